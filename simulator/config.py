@@ -66,13 +66,19 @@ SYMBOL_GENERATION_WEIGHTS_FS = {
 def _normalize_weights(weights_dict: Dict[str, float]) -> Tuple[np.ndarray, np.ndarray]:
     """Convert weight dictionary to normalized NumPy arrays."""
     symbols = list(weights_dict.keys())
-    weights = np.array([weights_dict[s] for s in symbols], dtype=np.float64)
-    weights = weights / weights.sum()  # Normalize to sum to 1.0
+    weights = np.fromiter(weights_dict.values(), dtype=np.float64, count=len(symbols))
+    weights /= weights.sum()  # Normalize to sum to 1.0
     return np.array(symbols), weights
 
+def _rebuild_weight_arrays() -> None:
+    """Regenerate the NumPy weight arrays from the weight dictionaries."""
+    global BG_SYMBOL_NAMES, BG_WEIGHTS, FS_SYMBOL_NAMES, FS_WEIGHTS
+    
+    BG_SYMBOL_NAMES, BG_WEIGHTS = _normalize_weights(SYMBOL_GENERATION_WEIGHTS_BG)
+    FS_SYMBOL_NAMES, FS_WEIGHTS = _normalize_weights(SYMBOL_GENERATION_WEIGHTS_FS)
+
 # Generate NumPy arrays from dictionaries
-BG_SYMBOL_NAMES, BG_WEIGHTS = _normalize_weights(SYMBOL_GENERATION_WEIGHTS_BG)
-FS_SYMBOL_NAMES, FS_WEIGHTS = _normalize_weights(SYMBOL_GENERATION_WEIGHTS_FS)
+_rebuild_weight_arrays()
 
 # Paytable Configuration
 # Key: (symbol, cluster_size), Value: payout multiplier
@@ -167,13 +173,33 @@ CLUSTER_PAYS = {
     "CYAN_SK": [0.3, 0.3, 0.4, 0.4, 0.6, 0.6, 1.0, 1.0, 1.0, 1.5, 10.0]
 }
 
+# Paytable as a 2-D array indexed by [paying symbol id, cluster size]
+# Columns 0-4 stay zero; column 15 holds the 15+ payout
+MAX_PAYTABLE_SIZE = 15
+PAYING_SYMBOL_IDS = {symbol: idx for idx, symbol in enumerate(PAYING_SYMBOLS)}
+
+def _build_paytable_array() -> np.ndarray:
+    """
+    Convert the PAYTABLE dictionary to a dense payout array.
+    
+    Entries for unknown symbols are skipped here and reported by
+    validate_config.
+    """
+    table = np.zeros((len(PAYING_SYMBOLS), MAX_PAYTABLE_SIZE + 1), dtype=np.float64)
+    for (symbol, size), payout in PAYTABLE.items():
+        symbol_id = PAYING_SYMBOL_IDS.get(symbol)
+        if symbol_id is not None:
+            table[symbol_id, size] = payout
+    return table
+
+PAYTABLE_ARR = _build_paytable_array()
+
 def get_payout(symbol: str, cluster_size: int) -> float:
     """Get payout for a symbol and cluster size."""
-    if cluster_size < 5:
+    symbol_id = PAYING_SYMBOL_IDS.get(symbol)
+    if symbol_id is None or cluster_size < 0:
         return 0.0
-    if cluster_size >= 15:
-        cluster_size = 15
-    return PAYTABLE.get((symbol, cluster_size), 0.0)
+    return float(PAYTABLE_ARR[symbol_id, min(cluster_size, MAX_PAYTABLE_SIZE)])
 
 # Game Configuration
 GRID_SIZE = 5
@@ -223,21 +249,23 @@ EXPLOSION_AFFECTS_ONLY_LP = True  # Only destroys low-pay symbols
 
 def validate_config() -> None:
     """Validate configuration integrity at runtime."""
-    # Check weight sums
-    bg_sum = sum(SYMBOL_GENERATION_WEIGHTS_BG.values())
-    fs_sum = sum(SYMBOL_GENERATION_WEIGHTS_FS.values())
+    bg_values = np.fromiter(SYMBOL_GENERATION_WEIGHTS_BG.values(), dtype=np.float64,
+                            count=len(SYMBOL_GENERATION_WEIGHTS_BG))
+    fs_values = np.fromiter(SYMBOL_GENERATION_WEIGHTS_FS.values(), dtype=np.float64,
+                            count=len(SYMBOL_GENERATION_WEIGHTS_FS))
     
-    if bg_sum <= 0 or fs_sum <= 0:
+    # Check weight sums
+    if bg_values.sum() <= 0 or fs_values.sum() <= 0:
         raise ValueError("Weight sums must be positive")
     
     # Check for negative weights
-    for symbol, weight in SYMBOL_GENERATION_WEIGHTS_BG.items():
-        if weight < 0:
-            raise ValueError(f"Negative weight for {symbol} in base game")
+    if (bg_values < 0).any():
+        symbol = list(SYMBOL_GENERATION_WEIGHTS_BG)[np.argmax(bg_values < 0)]
+        raise ValueError(f"Negative weight for {symbol} in base game")
     
-    for symbol, weight in SYMBOL_GENERATION_WEIGHTS_FS.items():
-        if weight < 0:
-            raise ValueError(f"Negative weight for {symbol} in free spins")
+    if (fs_values < 0).any():
+        symbol = list(SYMBOL_GENERATION_WEIGHTS_FS)[np.argmax(fs_values < 0)]
+        raise ValueError(f"Negative weight for {symbol} in free spins")
     
     # Check symbol sets match
     bg_symbols = set(SYMBOL_GENERATION_WEIGHTS_BG.keys())
@@ -261,9 +289,11 @@ def validate_config() -> None:
         raise ValueError("FS weights don't sum to 1.0")
     
     # Check all symbols in paytable are valid
-    for symbol, _ in PAYTABLE.keys():
-        if symbol not in PAYING_SYMBOLS:
-            raise ValueError(f"Invalid symbol in paytable: {symbol}")
+    paytable_symbols = np.array([symbol for symbol, _ in PAYTABLE])
+    valid = np.isin(paytable_symbols, PAYING_SYMBOLS)
+    if not valid.all():
+        symbol = paytable_symbols[np.argmin(valid)]
+        raise ValueError(f"Invalid symbol in paytable: {symbol}")
 
 def save_weights(filename: str) -> None:
     """Save current weights to JSON file."""
@@ -274,13 +304,13 @@ def save_weights(filename: str) -> None:
         "version": "1.0"
     }
     
+    # Compact separators keep encoding cheap in weight-sweep loops
     with open(filename, 'w') as f:
-        json.dump(data, f, indent=2)
+        f.write(json.dumps(data, separators=(',', ':')))
 
 def load_weights(filename: str) -> None:
     """Load weights from JSON file and regenerate arrays."""
     global SYMBOL_GENERATION_WEIGHTS_BG, SYMBOL_GENERATION_WEIGHTS_FS
-    global BG_SYMBOL_NAMES, BG_WEIGHTS, FS_SYMBOL_NAMES, FS_WEIGHTS
     
     with open(filename, 'r') as f:
         data = json.load(f)
@@ -289,8 +319,7 @@ def load_weights(filename: str) -> None:
     SYMBOL_GENERATION_WEIGHTS_FS = data["free_spins"]
     
     # Regenerate arrays
-    BG_SYMBOL_NAMES, BG_WEIGHTS = _normalize_weights(SYMBOL_GENERATION_WEIGHTS_BG)
-    FS_SYMBOL_NAMES, FS_WEIGHTS = _normalize_weights(SYMBOL_GENERATION_WEIGHTS_FS)
+    _rebuild_weight_arrays()
     
     # Validate after loading
     validate_config()
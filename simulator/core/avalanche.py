@@ -10,8 +10,9 @@ from enum import Enum, auto
 from typing import List, Optional, Tuple, Dict, Any
 from dataclasses import dataclass, field
 import logging
+import numpy as np
 
-from simulator.core.symbol import Symbol, is_scatter
+from simulator.core.symbol import Symbol, EMPTY_CODE, SCATTER_CODE
 from simulator.core.grid import Grid, ROWS, COLS
 from simulator.core.rng import SpinRNG
 from simulator.core.clusters import ClusterDetector, Cluster
@@ -116,8 +117,8 @@ class AvalancheSystem:
             bet_amount: Bet amount in cents
             is_free_spins: Whether this is a free spins round
         """
-        self.grid.clear()
-        self.explosion_system.reset_cascade_state()
+        self.grid.reset()
+        self.explosion_system.reset(preserve_collected=True)
         self.state = AvalancheState(
             bet_amount=bet_amount,
             is_free_spins=is_free_spins
@@ -224,8 +225,7 @@ class AvalancheSystem:
             
             # Remove winning symbols
             for cluster in clusters:
-                for pos in cluster.positions:
-                    self.grid.set_symbol(pos[0], pos[1], Symbol.EMPTY)
+                cluster.clear_on(self.grid)
             
             # Spawn wilds
             spawns = self.wild_spawner.spawn_wilds_for_clusters(self.grid, clusters, rng)
@@ -284,12 +284,9 @@ class AvalancheSystem:
             symbols = BG_SYMBOL_NAMES
             weights = BG_WEIGHTS
             
-        # Fill all positions
-        for row in range(ROWS):
-            for col in range(COLS):
-                symbol_name = rng.weighted_choice_numpy(symbols, weights)
-                symbol = Symbol[symbol_name]
-                self.grid.set_symbol(row, col, symbol)
+        # Fill all positions, row-major, in one batch of draws
+        codes = np.array([Symbol[name] for name in symbols], dtype=np.int8)
+        self.grid.load_array(rng.weighted_choice_numpy_batch(codes, weights, ROWS * COLS))
         
         # Handle "The Enrico Show" - force one EW
         if force_enrico and not self.state.is_free_spins:
@@ -308,26 +305,18 @@ class AvalancheSystem:
             symbols = BG_SYMBOL_NAMES
             weights = BG_WEIGHTS
             
-        # Fill empty positions
-        filled_count = 0
-        for row in range(ROWS):
-            for col in range(COLS):
-                if self.grid.get_symbol(row, col) == Symbol.EMPTY:
-                    symbol_name = rng.weighted_choice_numpy(symbols, weights)
-                    symbol = Symbol[symbol_name]
-                    self.grid.set_symbol(row, col, symbol)
-                    filled_count += 1
-                    
+        # Fill empty positions, row-major, in one batch of draws
+        empty = np.flatnonzero(self.grid.cells() == EMPTY_CODE)
+        filled_count = len(empty)
+        if filled_count:
+            codes = np.array([Symbol[name] for name in symbols], dtype=np.int8)
+            self.grid.set_batch(empty, rng.weighted_choice_numpy_batch(codes, weights, filled_count))
+            
         logger.debug(f"Filled {filled_count} empty positions")
         
     def _count_scatters(self) -> int:
         """Count all visible scatter symbols."""
-        count = 0
-        for row in range(ROWS):
-            for col in range(COLS):
-                if is_scatter(self.grid.get_symbol(row, col)):
-                    count += 1
-        return count
+        return int(np.count_nonzero(self.grid.cells() == SCATTER_CODE))
         
     def _process_cluster_wins(self, clusters: List[Cluster], result: CascadeResult) -> int:
         """
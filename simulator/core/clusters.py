@@ -1,71 +1,297 @@
 """
 Cluster detection system for Esqueleto Explosivo 3.
 
-This module implements the cluster pays winning system using the Union-Find
-algorithm for efficient detection of connected symbol groups.
+This module implements the cluster pays winning system using bitboard
+flood fill for efficient detection of connected symbol groups.
 """
 
-from typing import List, Dict, Set, Tuple, Optional
-from dataclasses import dataclass
+from typing import List, Dict, FrozenSet, Set, Tuple, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+import numpy as np
 from simulator.core.symbol import (
-    Symbol, is_paying, is_wild, is_scatter, is_empty,
-    symbols_match_for_cluster, get_config_string
+    Symbol, is_paying, is_scatter, is_empty,
+    symbols_match_for_cluster, get_config_string,
+    PAYING_SYMBOLS, WILD_SYMBOLS
 )
+from simulator.config import MIN_CLUSTER_SIZE
 from simulator.core.union_find import GridUnionFind
-from simulator.core.grid import Grid, ROWS, COLS
+from simulator.core.grid import (
+    Grid, ROWS, COLS, TOTAL_POSITIONS, POSITIONS, _SYMBOL_BY_CODE, mask_to_positions
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class Cluster:
     """Represents a winning cluster of symbols."""
     symbol: Symbol  # The paying symbol type (not wild)
     positions: List[Tuple[int, int]]  # All positions in cluster
     size: int  # Number of symbols (including wilds)
+    # Bit (row * COLS + col) is set for each position; derived if omitted
+    position_mask: int = field(default=0, repr=False, compare=False)
+    # Flat row-major index of each position, in positions order; derived if omitted
+    indices: Tuple[int, ...] = field(default=(), repr=False, compare=False)
+    # Frozen copy of positions, built on first use by position_set
+    _position_set: Optional[FrozenSet[Tuple[int, int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        if not self.indices:
+            indices = []
+            for row, col in self.positions:
+                if not (0 <= row < ROWS and 0 <= col < COLS):
+                    raise ValueError(f"Position ({row}, {col}) out of bounds")
+                indices.append(row * COLS + col)
+            self.indices = tuple(indices)
+        if not self.position_mask:
+            for idx in self.indices:
+                self.position_mask |= 1 << idx
+    
+    @property
+    def position_set(self) -> FrozenSet[Tuple[int, int]]:
+        """Immutable set of the cluster's positions, shared by all callers."""
+        if self._position_set is None:
+            self._position_set = frozenset(self.positions)
+        return self._position_set
+    
+    def __contains__(self, pos: Tuple[int, int]) -> bool:
+        """Check whether a (row, col) position is part of the cluster."""
+        row, col = pos
+        if not (0 <= row < ROWS and 0 <= col < COLS):
+            return False
+        return bool(self.position_mask >> (row * COLS + col) & 1)
+    
+    def clear_on(self, grid: Grid) -> None:
+        """Set every cell of the cluster on the grid to EMPTY."""
+        grid.set_mask(self.position_mask, Symbol.EMPTY)
     
     def __repr__(self) -> str:
         return f"Cluster({get_config_string(self.symbol)}, size={self.size})"
 
 
-class ClusterDetector:
+class ClusterResult(list):
     """
-    Detects winning clusters in the game grid.
+    Clusters found by one detection pass.
     
-    Uses Union-Find algorithm for efficient O(α(n)) detection where α is the
-    inverse Ackermann function (practically constant).
+    Behaves exactly like the list of clusters in processing order, and
+    adds per-symbol access for callers that aggregate wins by symbol.
     """
     
-    def __init__(self):
-        """Initialize cluster detector with reusable Union-Find structure."""
-        self._union_find = GridUnionFind()
-        self._adjacent_cache = self._precompute_adjacents()
+    @property
+    def all(self) -> List[Cluster]:
+        """All clusters in processing order."""
+        return self
     
-    def _precompute_adjacents(self) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
-        """
-        Precompute adjacent positions for each grid position.
+    @property
+    def by_symbol(self) -> Dict[Symbol, List[Cluster]]:
+        """Clusters grouped by paying symbol, each group in processing order."""
+        groups: Dict[Symbol, List[Cluster]] = {}
+        for cluster in self:
+            groups.setdefault(cluster.symbol, []).append(cluster)
+        return groups
+    
+    @property
+    def symbol_mask(self) -> int:
+        """Bitmask with bit int(symbol) set for every symbol that won."""
+        mask = 0
+        for cluster in self:
+            mask |= 1 << cluster.symbol
+        return mask
+    
+    @property
+    def symbols(self) -> FrozenSet[Symbol]:
+        """Set of paying symbols that formed at least one cluster."""
+        return frozenset(cluster.symbol for cluster in self)
+
+
+# Integer symbol codes used by the detection kernel
+_PAYING_CODES = tuple(sorted(int(symbol) for symbol in PAYING_SYMBOLS))
+_WILD_CODES = frozenset(int(symbol) for symbol in WILD_SYMBOLS)
+_NUM_CODES = max(Symbol) + 1
+
+# Bitboard layout: bit (row * COLS + col) represents cell (row, col)
+BOARD_MASK = (1 << TOTAL_POSITIONS) - 1
+LEFT_EDGE_MASK = sum(1 << (row * COLS) for row in range(ROWS))
+RIGHT_EDGE_MASK = LEFT_EDGE_MASK << (COLS - 1)
+_NOT_LEFT_EDGE = BOARD_MASK & ~LEFT_EDGE_MASK
+_NOT_RIGHT_EDGE = BOARD_MASK & ~RIGHT_EDGE_MASK
+
+# Bit value of each cell as a bincount weight; sums of distinct powers of
+# two below 2**53 are exact in float64, so summing per code ORs the bits
+_CELL_BITS = np.array([1 << idx for idx in range(TOTAL_POSITIONS)], dtype=np.float64)
+
+
+def _build_adjacency() -> np.ndarray:
+    """
+    Build the 4-neighbour adjacency table for the grid.
+    
+    Returns:
+        (TOTAL_POSITIONS, 5) int8 array; row i holds the neighbour count
+        followed by the flat neighbour indices (up, down, left, right),
+        padded with -1
+    """
+    adjacency = np.full((TOTAL_POSITIONS, 5), -1, dtype=np.int8)
+    for idx in range(TOTAL_POSITIONS):
+        row, col = divmod(idx, COLS)
+        count = 0
+        for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            n_row, n_col = row + d_row, col + d_col
+            if 0 <= n_row < ROWS and 0 <= n_col < COLS:
+                count += 1
+                adjacency[idx, count] = n_row * COLS + n_col
+        adjacency[idx, 0] = count
+    return adjacency
+
+
+_ADJ = _build_adjacency()
+_ADJ.setflags(write=False)
+
+# Neighbour indices and 4-neighbourhood bitboard of every cell, from _ADJ
+_NEIGHBOR_INDICES = tuple(tuple(row[1:1 + row[0]]) for row in _ADJ.tolist())
+_NEIGHBORS4 = tuple(sum(1 << nb for nb in neighbors) for neighbors in _NEIGHBOR_INDICES)
+
+
+# Config string of each paying code, used as the cluster sort key
+_CONFIG_STRING_BY_CODE = {code: get_config_string(Symbol(code)) for code in _PAYING_CODES}
+
+
+def _mask_to_indices(mask: int) -> Tuple[int, ...]:
+    """List the flat indices of a bitboard in row-major order."""
+    indices = []
+    while mask:
+        low = mask & -mask
+        indices.append(low.bit_length() - 1)
+        mask ^= low
+    return tuple(indices)
+
+
+def _cluster_from_component(code: int, component: int) -> Cluster:
+    """Build the Cluster for one labelled component bitboard."""
+    indices = _mask_to_indices(component)
+    return Cluster(
+        symbol=_SYMBOL_BY_CODE[code],
+        positions=[POSITIONS[idx] for idx in indices],
+        size=min(len(indices), 15),  # Cap at 15
+        position_mask=component,
+        indices=indices
+    )
+
+
+def _symbol_masks(codes: np.ndarray) -> List[int]:
+    """
+    Build one bitboard per symbol code from a flat array of codes.
+    
+    Args:
+        codes: Row-major int8 array of the 25 cell codes
         
-        Returns:
-            Dictionary mapping positions to their adjacent positions
-        """
-        adjacents = {}
+    Returns:
+        List indexed by symbol code of that code's bitboard
+    """
+    masks = np.bincount(codes, weights=_CELL_BITS, minlength=_NUM_CODES)
+    return masks.astype(np.int64).tolist()
+
+
+def _label_clusters(codes: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    Label winning clusters on a flat row-major grid of symbol codes.
+    
+    Each paying code gets a bitboard of its cells OR'd with the wild
+    bitboard, so wilds bridging two symbols end up in both clusters.
+    Components are grown from a paying seed cell by bit-parallel 4-way
+    dilation until they stop changing, which also means components made
+    only of wilds are never produced. The dilation is written out inline
+    for the fixed 5x5 board, and seeds with no matching neighbour are
+    settled with a single table lookup.
+    
+    Args:
+        codes: Row-major int8 array of the 25 cell codes
         
-        for row in range(ROWS):
-            for col in range(COLS):
-                adj = []
-                # Check all 4 directions (no diagonals)
-                if row > 0:  # Up
-                    adj.append((row - 1, col))
-                if row < ROWS - 1:  # Down
-                    adj.append((row + 1, col))
-                if col > 0:  # Left
-                    adj.append((row, col - 1))
-                if col < COLS - 1:  # Right
-                    adj.append((row, col + 1))
-                
-                adjacents[(row, col)] = adj
+    Returns:
+        List of (paying code, component bitboard) for every component of
+        at least 5 cells, in order of first appearance of the paying code
+        and then of the component
+    """
+    masks = _symbol_masks(codes)
+    
+    wild_mask = 0
+    for code in _WILD_CODES:
+        wild_mask |= masks[code]
+    
+    # Paying codes in order of first appearance on the grid, skipping any
+    # that cannot reach a cluster even with every wild on the board
+    needed = MIN_CLUSTER_SIZE - wild_mask.bit_count()
+    present = [code for code in _PAYING_CODES
+               if masks[code] and masks[code].bit_count() >= needed]
+    present.sort(key=lambda code: masks[code] & -masks[code])
+    
+    labels = []
+    for paying in present:
+        remaining = masks[paying]
+        match_mask = remaining | wild_mask
+        
+        # A connected group of 5 cells has at least 4 adjacent pairs, so a
+        # symbol with fewer matching pairs anywhere cannot win
+        pairs = ((match_mask & _NOT_RIGHT_EDGE) & (match_mask >> 1)).bit_count() \
+            + (match_mask & (match_mask >> COLS)).bit_count()
+        if pairs < MIN_CLUSTER_SIZE - 1:
+            continue
+        components = []
+        
+        while remaining:
+            seed = remaining & -remaining
+            component = seed | (_NEIGHBORS4[seed.bit_length() - 1] & match_mask)
+            if component == seed:
+                # Isolated cell, nothing to grow
+                remaining ^= seed
+                continue
+            while True:
+                grown = (component
+                         | (component & _NOT_LEFT_EDGE) >> 1
+                         | (component & _NOT_RIGHT_EDGE) << 1
+                         | component >> COLS
+                         | component << COLS) & match_mask
+                if grown == component:
+                    break
+                component = grown
+            remaining &= ~component
+            if component.bit_count() >= MIN_CLUSTER_SIZE:
+                components.append(component)
         
-        return adjacents
+        if len(components) > 1:
+            # Order components by their first cell, wilds included
+            components.sort(key=lambda component: component & -component)
+        labels.extend((paying, component) for component in components)
     
-    def find_clusters(self, grid: Grid) -> List[Cluster]:
+    return labels
+
+
+@lru_cache(maxsize=1 << 16)
+def _label_clusters_cached(state: bytes) -> Tuple[Tuple[int, int], ...]:
+    """Memoized _label_clusters keyed on the raw bytes of the code array."""
+    return tuple(_label_clusters(np.frombuffer(state, dtype=np.int8)))
+
+
+class ClusterDetector:
+    """
+    Detects winning clusters in the game grid.
+    
+    Detection reads the grid's symbol codes straight from its backing
+    array, packs them into one 25-bit bitboard per symbol and finds
+    connected components with bit-parallel flood fill.
+    
+    With cache_enabled, labels are memoized per grid state in a shared
+    LRU cache. That pays off for replay/analysis runs that revisit the
+    same boards; forward simulations rarely repeat a board and should
+    leave it off.
+    """
+    
+    def __init__(self, cache_enabled: bool = False):
+        """Initialize cluster detector with reusable Union-Find structure."""
+        self._union_find = GridUnionFind()
+        self.cache_enabled = cache_enabled
+    
+    def find_clusters(self, grid: Grid) -> ClusterResult:
         """
         Find all winning clusters in the grid.
         
@@ -76,110 +302,22 @@ class ClusterDetector:
             grid: The game grid to analyze
             
         Returns:
-            List of Cluster objects representing all winning clusters
+            ClusterResult list of all winning clusters
         """
-        # Reset Union-Find for new detection
-        self._union_find.reset()
-        
-        # Track which symbols are at which positions for wild handling
-        symbol_positions: Dict[Symbol, List[Tuple[int, int]]] = {}
-        position_symbols: Dict[Tuple[int, int], Symbol] = {}
-        
-        # First pass: collect all non-empty, non-scatter positions
-        for row in range(ROWS):
-            for col in range(COLS):
-                symbol = grid.get_symbol(row, col)
-                
-                if is_empty(symbol) or is_scatter(symbol):
-                    continue
-                
-                pos = (row, col)
-                position_symbols[pos] = symbol
-                
-                if is_paying(symbol):  # Track paying symbols by type
-                    if symbol not in symbol_positions:
-                        symbol_positions[symbol] = []
-                    symbol_positions[symbol].append(pos)
+        if self.cache_enabled:
+            labels = _label_clusters_cached(grid.cells().tobytes())
+        else:
+            labels = _label_clusters(grid.cells().ravel())
+        if not labels:
+            return ClusterResult()
         
-        # Process each paying symbol type separately to handle wild participation
-        clusters = []
-        
-        for symbol, positions in symbol_positions.items():
-            # Create a new Union-Find for this symbol type
-            uf = GridUnionFind()
-            
-            # Track all positions that could be in this symbol's clusters
-            relevant_positions = set(positions)
-            
-            # Add all wild positions as potentially relevant
-            for pos, sym in position_symbols.items():
-                if is_wild(sym):
-                    relevant_positions.add(pos)
-            
-            # Union adjacent positions that match
-            for pos in relevant_positions:
-                row, col = pos
-                pos_symbol = position_symbols[pos]
-                
-                # Check adjacent positions
-                for adj_row, adj_col in self._adjacent_cache[pos]:
-                    adj_pos = (adj_row, adj_col)
-                    
-                    if adj_pos not in position_symbols:
-                        continue
-                    
-                    adj_symbol = position_symbols[adj_pos]
-                    
-                    # Check if these symbols can form a cluster
-                    # For this symbol type's cluster:
-                    # - Same symbol connects
-                    # - Wild connects to paying symbol
-                    # - Wild connects to wild
-                    can_connect = False
-                    
-                    if is_wild(pos_symbol) and is_wild(adj_symbol):
-                        # Wild to wild always connects
-                        can_connect = True
-                    elif is_wild(pos_symbol) and adj_symbol == symbol:
-                        # Wild to this symbol type
-                        can_connect = True
-                    elif pos_symbol == symbol and is_wild(adj_symbol):
-                        # This symbol type to wild
-                        can_connect = True
-                    elif pos_symbol == symbol and adj_symbol == symbol:
-                        # Same symbol type
-                        can_connect = True
-                    
-                    if can_connect:
-                        uf.union_positions(row, col, adj_row, adj_col)
-            
-            # Extract clusters for this symbol type
-            cluster_groups = uf.get_sets()
-            
-            for root_idx, member_indices in cluster_groups.items():
-                # Convert indices to positions
-                cluster_positions = []
-                has_paying_symbol = False
-                
-                for idx in member_indices:
-                    pos = uf._index_to_pos(idx)
-                    if pos in position_symbols:
-                        cluster_positions.append(pos)
-                        if position_symbols[pos] == symbol:
-                            has_paying_symbol = True
-                
-                # Valid cluster must have at least 5 symbols and contain
-                # at least one non-wild symbol
-                if len(cluster_positions) >= 5 and has_paying_symbol:
-                    cluster = Cluster(
-                        symbol=symbol,
-                        positions=cluster_positions,
-                        size=min(len(cluster_positions), 15)  # Cap at 15
-                    )
-                    clusters.append(cluster)
+        clusters = ClusterResult(
+            _cluster_from_component(code, component) for code, component in labels
+        )
         
         # Sort clusters for consistent processing order
-        clusters.sort(key=lambda c: (get_config_string(c.symbol), c.size), reverse=True)
+        if len(clusters) > 1:
+            clusters.sort(key=lambda c: (_CONFIG_STRING_BY_CODE[c.symbol], c.size), reverse=True)
         
         return clusters
     
@@ -193,10 +331,12 @@ class ClusterDetector:
         Returns:
             Set of all positions in any winning cluster
         """
-        winning_positions = set()
+        # OR the footprint bitboards, so shared cells are merged before
+        # any (row, col) tuple is hashed
+        mask = 0
         for cluster in clusters:
-            winning_positions.update(cluster.positions)
-        return winning_positions
+            mask |= cluster.position_mask
+        return set(mask_to_positions(mask))
     
     def get_cluster_footprint(self, clusters: List[Cluster]) -> Set[Tuple[int, int]]:
         """
@@ -227,24 +367,17 @@ class ClusterDetector:
         """
         self._union_find.reset()
         
+        symbols = [grid.get_symbol(row, col) for row, col in POSITIONS]
+        
         # Union all adjacent matching symbols
-        for row in range(ROWS):
-            for col in range(COLS):
-                symbol = grid.get_symbol(row, col)
-                
-                if is_empty(symbol) or is_scatter(symbol):
-                    continue
-                
-                # Check right and down only (to avoid double-checking)
-                if col < COLS - 1:  # Right
-                    right_symbol = grid.get_symbol(row, col + 1)
-                    if symbols_match_for_cluster(symbol, right_symbol):
-                        self._union_find.union_positions(row, col, row, col + 1)
-                
-                if row < ROWS - 1:  # Down
-                    down_symbol = grid.get_symbol(row + 1, col)
-                    if symbols_match_for_cluster(symbol, down_symbol):
-                        self._union_find.union_positions(row, col, row + 1, col)
+        for idx, symbol in enumerate(symbols):
+            if is_empty(symbol) or is_scatter(symbol):
+                continue
+            
+            # Check later neighbours only (to avoid double-checking)
+            for neighbor in _NEIGHBOR_INDICES[idx]:
+                if neighbor > idx and symbols_match_for_cluster(symbol, symbols[neighbor]):
+                    self._union_find.union(idx, neighbor)
         
         # Extract clusters
         clusters = []
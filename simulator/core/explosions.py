@@ -9,54 +9,265 @@ low-pay symbols in a 3x3 area. Key features:
 - All eligible EWs explode simultaneously
 """
 
-from typing import List, Set, Tuple, Dict, Optional
-from dataclasses import dataclass, field
-from simulator.core.symbol import Symbol, is_low_pay, is_explosivo_wild
-from simulator.core.grid import Grid, ROWS, COLS
+from typing import AbstractSet, Iterable, List, Tuple, Dict, Optional
+from dataclasses import dataclass
+from simulator.core.symbol import Symbol, LOW_PAY_CODES, E_WILD_CODE
+from simulator.core.grid import (
+    Grid, ROWS, COLS, TOTAL_POSITIONS, POSITIONS, flags_to_mask, mask_to_positions
+)
 from simulator.core.clusters import Cluster
+import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Lookup table indexed by symbol code: True only for the low-pay symbols
+# explosions destroy (high-pay, wilds, other EWs and scatters survive)
+_DESTROY_LUT = np.zeros(256, dtype=np.bool_)
+_DESTROY_LUT[list(LOW_PAY_CODES)] = True
+_DESTROY_LUT.setflags(write=False)
 
-@dataclass
+
+def _ew_mask(grid: Grid) -> int:
+    """Bitmask of the grid's E_WILD positions (bit row * COLS + col)."""
+    return flags_to_mask(grid.cells().ravel() == E_WILD_CODE)
+
+
+def _build_explosion_neighbors() -> np.ndarray:
+    """
+    Build the clamped 3x3 explosion neighbourhood table for the grid.
+    
+    Returns:
+        (TOTAL_POSITIONS, 9) int8 array; row i holds the flat indices of
+        the on-grid cells around index i (itself included) in row-major
+        order, padded with -1
+    """
+    neighbors = np.full((TOTAL_POSITIONS, 9), -1, dtype=np.int8)
+    for idx in range(TOTAL_POSITIONS):
+        row, col = divmod(idx, COLS)
+        slot = 0
+        for r in range(max(0, row - 1), min(ROWS, row + 2)):
+            for c in range(max(0, col - 1), min(COLS, col + 2)):
+                neighbors[idx, slot] = r * COLS + c
+                slot += 1
+    return neighbors
+
+
+_NEIGHBORS = _build_explosion_neighbors()
+_NEIGHBORS.setflags(write=False)
+
+# Explosion area of every cell, derived from _NEIGHBORS: as flat indices,
+# as (row, col) tuples keyed by EW position, and as bitboards indexed by
+# the EW's flat index
+_AREA_INDICES = tuple(tuple(cell for cell in row if cell >= 0) for row in _NEIGHBORS.tolist())
+_AREA: Dict[Tuple[int, int], Tuple[Tuple[int, int], ...]] = {
+    POSITIONS[idx]: tuple(POSITIONS[cell] for cell in cells)
+    for idx, cells in enumerate(_AREA_INDICES)
+}
+_AREA_BITS: Tuple[int, ...] = tuple(sum(1 << cell for cell in cells) for cells in _AREA_INDICES)
+
+
+def _explosion_kernel(codes: np.ndarray, ew_idxs: List[int]) -> Tuple[List[int], int]:
+    """
+    Resolve simultaneous explosions on a flat array of symbol codes.
+    
+    Works entirely on bitboards: one gather finds the destroyable cells,
+    then each EW's area bitboard is ANDed with them.
+    
+    Args:
+        codes: Row-major int8 array of the 25 cell codes
+        ew_idxs: Flat indices of the exploding EWs
+        
+    Returns:
+        Tuple of (per-EW bitboard of destroyed cells, union of those
+        bitboards)
+    """
+    destroyable = flags_to_mask(_DESTROY_LUT[codes])
+    destroyed_masks = [_AREA_BITS[idx] & destroyable for idx in ew_idxs]
+    destroyed_all = 0
+    for destroyed in destroyed_masks:
+        destroyed_all |= destroyed
+    return destroyed_masks, destroyed_all
+
+
+@dataclass(frozen=True, slots=True)
 class ExplosionEvent:
     """Represents a single EW explosion event."""
-    ew_position: Tuple[int, int]  # Position of the exploding EW
-    affected_area: List[Tuple[int, int]]  # 3x3 area around EW
-    destroyed_positions: List[Tuple[int, int]]  # Positions actually destroyed
+    ew_index: int  # Flat index (row * COLS + col) of the exploding EW
+    destroyed_mask: int  # Bitmask of the cells actually destroyed
     from_cluster: bool = False  # Whether EW was in winning cluster
+    
+    @classmethod
+    def from_positions(
+        cls,
+        ew_position: Tuple[int, int],
+        affected_area: Iterable[Tuple[int, int]],
+        destroyed_positions: Iterable[Tuple[int, int]],
+        from_cluster: bool = False
+    ) -> 'ExplosionEvent':
+        """
+        Build an event from (row, col) positions, as the original fields took them.
+        
+        affected_area is accepted for compatibility only; it is always
+        derived from ew_position.
+        """
+        destroyed_mask = 0
+        for row, col in destroyed_positions:
+            destroyed_mask |= 1 << (row * COLS + col)
+        row, col = ew_position
+        return cls(row * COLS + col, destroyed_mask, from_cluster)
+    
+    @property
+    def destroyed_positions(self) -> List[Tuple[int, int]]:
+        """Positions actually destroyed, in row-major order."""
+        return mask_to_positions(self.destroyed_mask)
+    
+    @property
+    def destroyed_count(self) -> int:
+        """Number of cells destroyed, without building the position list."""
+        return self.destroyed_mask.bit_count()
+    
+    @property
+    def ew_position(self) -> Tuple[int, int]:
+        """Position of the exploding EW."""
+        return POSITIONS[self.ew_index]
+    
+    @property
+    def affected_area(self) -> Tuple[Tuple[int, int], ...]:
+        """3x3 area around the EW (on-grid cells only), in row-major order."""
+        return _AREA[POSITIONS[self.ew_index]]
+
+
+class PositionMaskView:
+    """
+    Set-like view of one of an EWTracker's position bitmasks.
+    
+    Supports add/discard/clear, membership, len, row-major iteration and
+    equality with sets of (row, col) tuples, reading and writing the
+    tracker's int mask.
+    """
+    __slots__ = ('_tracker', '_attr')
+    
+    def __init__(self, tracker: 'EWTracker', attr: str):
+        self._tracker = tracker
+        self._attr = attr
+    
+    @property
+    def mask(self) -> int:
+        return getattr(self._tracker, self._attr)
+    
+    def add(self, position: Tuple[int, int]) -> None:
+        setattr(self._tracker, self._attr,
+                self.mask | 1 << EWTracker._idx(position))
+    
+    def discard(self, position: Tuple[int, int]) -> None:
+        setattr(self._tracker, self._attr,
+                self.mask & ~(1 << EWTracker._idx(position)))
+    
+    def clear(self) -> None:
+        setattr(self._tracker, self._attr, 0)
+    
+    def __contains__(self, position: Tuple[int, int]) -> bool:
+        row, col = position
+        if not (0 <= row < ROWS and 0 <= col < COLS):
+            return False
+        return bool(self.mask >> (row * COLS + col) & 1)
+    
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+    
+    def __iter__(self):
+        return iter(mask_to_positions(self.mask))
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PositionMaskView):
+            return self.mask == other.mask
+        if isinstance(other, AbstractSet):
+            return len(self) == len(other) and all(position in self for position in other)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"PositionMaskView({mask_to_positions(self.mask)})"
 
 
 @dataclass 
 class EWTracker:
-    """Tracks Explosivo Wild states for explosion eligibility."""
+    """
+    Tracks Explosivo Wild states for explosion eligibility.
+    
+    Each state is an int bitmask with bit (row * COLS + col) set per
+    position; the *_this_drop/*_clusters/*_cascade properties expose
+    them as set-like views of (row, col) tuples.
+    """
     # EWs that landed this drop (from symbol generation)
-    landed_this_drop: Set[Tuple[int, int]] = field(default_factory=set)
+    landed_mask: int = 0
     
     # EWs that were in winning clusters
-    in_winning_clusters: Set[Tuple[int, int]] = field(default_factory=set)
+    in_winning_mask: int = 0
     
     # EWs spawned this cascade (not eligible)
-    spawned_this_cascade: Set[Tuple[int, int]] = field(default_factory=set)
+    spawned_mask: int = 0
     
     # EWs collected for free spins feature
     collected_count: int = 0
     
+    @staticmethod
+    def _idx(position: Tuple[int, int]) -> int:
+        """Bit index of a (row, col) position; ValueError if it is off the grid."""
+        row, col = position
+        if not (0 <= row < ROWS and 0 <= col < COLS):
+            raise ValueError(f"Position ({row}, {col}) out of bounds")
+        return row * COLS + col
+    
+    @property
+    def landed_this_drop(self) -> PositionMaskView:
+        return PositionMaskView(self, 'landed_mask')
+    
+    @property
+    def in_winning_clusters(self) -> PositionMaskView:
+        return PositionMaskView(self, 'in_winning_mask')
+    
+    @property
+    def spawned_this_cascade(self) -> PositionMaskView:
+        return PositionMaskView(self, 'spawned_mask')
+    
+    @property
+    def eligible_mask(self) -> int:
+        """Positions that landed or were in a cluster, minus spawned ones."""
+        return (self.landed_mask | self.in_winning_mask) & ~self.spawned_mask
+    
     def reset_cascade(self):
         """Reset cascade-specific tracking."""
-        self.landed_this_drop.clear()
-        self.in_winning_clusters.clear()
-        self.spawned_this_cascade.clear()
+        self.landed_mask = 0
+        self.in_winning_mask = 0
+        self.spawned_mask = 0
+    
+    def add_landed_idx(self, idx: int) -> None:
+        """Mark the EW at flat index idx as landed this drop."""
+        self.landed_mask |= 1 << idx
+    
+    def add_cluster_idx(self, idx: int) -> None:
+        """Mark the EW at flat index idx as part of a winning cluster."""
+        self.in_winning_mask |= 1 << idx
+    
+    def add_spawned_idx(self, idx: int) -> None:
+        """Mark the EW at flat index idx as spawned this cascade."""
+        self.spawned_mask |= 1 << idx
+    
+    def is_eligible(self, idx: int) -> bool:
+        """Check if an EW at flat index idx is eligible to explode."""
+        # EW is eligible if it landed this drop OR was in a winning cluster,
+        # but spawned EWs are never eligible in their spawn cascade
+        return bool(self.eligible_mask >> idx & 1)
     
     def is_eligible_to_explode(self, position: Tuple[int, int]) -> bool:
-        """Check if an EW at given position is eligible to explode."""
-        # Spawned EWs are never eligible in their spawn cascade
-        if position in self.spawned_this_cascade:
+        """Check if an EW at given (row, col) position is eligible to explode."""
+        row, col = position
+        if not (0 <= row < ROWS and 0 <= col < COLS):
             return False
-        
-        # EW is eligible if it landed this drop OR was in a winning cluster
-        return position in self.landed_this_drop or position in self.in_winning_clusters
+        return self.is_eligible(row * COLS + col)
 
 
 class ExplosionSystem:
@@ -74,20 +285,6 @@ class ExplosionSystem:
     def __init__(self):
         """Initialize the explosion system."""
         self.ew_tracker = EWTracker()
-        self._explosion_offsets = self._calculate_explosion_offsets()
-    
-    def _calculate_explosion_offsets(self) -> List[Tuple[int, int]]:
-        """
-        Pre-calculate the 3x3 offsets for explosion area.
-        
-        Returns:
-            List of (row_offset, col_offset) tuples for 3x3 area
-        """
-        offsets = []
-        for row_offset in range(-1, 2):
-            for col_offset in range(-1, 2):
-                offsets.append((row_offset, col_offset))
-        return offsets
     
     def track_landed_ews(self, grid: Grid):
         """
@@ -96,14 +293,9 @@ class ExplosionSystem:
         Args:
             grid: The game grid after symbols dropped
         """
-        self.ew_tracker.landed_this_drop.clear()
-        
-        for row in range(ROWS):
-            for col in range(COLS):
-                if is_explosivo_wild(grid.get_symbol(row, col)):
-                    self.ew_tracker.landed_this_drop.add((row, col))
+        self.ew_tracker.landed_mask = _ew_mask(grid)
         
-        logger.debug(f"Tracked {len(self.ew_tracker.landed_this_drop)} landed EWs")
+        logger.debug(f"Tracked {self.ew_tracker.landed_mask.bit_count()} landed EWs")
     
     def track_cluster_ews(self, clusters: List[Cluster], grid: Grid):
         """
@@ -113,17 +305,19 @@ class ExplosionSystem:
             clusters: List of winning clusters
             grid: The game grid
         """
-        self.ew_tracker.in_winning_clusters.clear()
+        tracker = self.ew_tracker
+        tracker.in_winning_mask = 0
+        ew_mask = _ew_mask(grid)
         
         for cluster in clusters:
-            for pos in cluster.positions:
-                if is_explosivo_wild(grid.get_symbol(pos[0], pos[1])):
-                    self.ew_tracker.in_winning_clusters.add(pos)
-                    # Collect EW immediately when in winning cluster
-                    self.ew_tracker.collected_count += 1
-                    logger.debug(f"Collected EW from winning cluster (total: {self.ew_tracker.collected_count})")
+            overlap = cluster.position_mask & ew_mask
+            if overlap:
+                tracker.in_winning_mask |= overlap
+                # Collect EWs immediately when in winning cluster
+                tracker.collected_count += overlap.bit_count()
+                logger.debug(f"Collected EW from winning cluster (total: {tracker.collected_count})")
         
-        logger.debug(f"Tracked {len(self.ew_tracker.in_winning_clusters)} cluster EWs")
+        logger.debug(f"Tracked {tracker.in_winning_mask.bit_count()} cluster EWs")
     
     def track_spawned_ew(self, position: Tuple[int, int]):
         """
@@ -132,10 +326,10 @@ class ExplosionSystem:
         Args:
             position: Position where EW was spawned
         """
-        self.ew_tracker.spawned_this_cascade.add(position)
+        self.ew_tracker.add_spawned_idx(EWTracker._idx(position))
         logger.debug(f"Tracked spawned EW at {position}")
     
-    def calculate_explosion_area(self, ew_position: Tuple[int, int]) -> List[Tuple[int, int]]:
+    def calculate_explosion_area(self, ew_position: Tuple[int, int]) -> Tuple[Tuple[int, int], ...]:
         """
         Calculate the 3x3 area affected by an EW explosion.
         
@@ -143,20 +337,43 @@ class ExplosionSystem:
             ew_position: Position of the exploding EW
             
         Returns:
-            List of positions in the explosion area (on-grid only)
+            Positions in the explosion area (on-grid only) in row-major
+            order; the same cached tuple is returned for an on-grid position
         """
-        row, col = ew_position
-        affected_positions = []
+        area = _AREA.get(ew_position)
+        if area is None:
+            # Off-grid centre: clip its 3x3 area to the grid
+            row, col = ew_position
+            area = tuple(
+                (r, c)
+                for r in range(max(row - 1, 0), min(row + 2, ROWS))
+                for c in range(max(col - 1, 0), min(col + 2, COLS))
+            )
+        return area
+    
+    def find_eligible_idxs(self, grid: Grid) -> List[int]:
+        """
+        Find the flat indices of all EWs eligible to explode.
         
-        for row_offset, col_offset in self._explosion_offsets:
-            new_row = row + row_offset
-            new_col = col + col_offset
+        Args:
+            grid: The current game grid
             
-            # Only include positions that are on the grid
-            if 0 <= new_row < ROWS and 0 <= new_col < COLS:
-                affected_positions.append((new_row, new_col))
+        Returns:
+            Row-major list of flat indices (row * COLS + col) of eligible EWs
+        """
+        eligible_idxs = []
+        candidates = self.ew_tracker.eligible_mask
+        if candidates:
+            # Only cells that still hold an EW can explode
+            candidates &= _ew_mask(grid)
         
-        return affected_positions
+        # Walk set bits lowest first, keeping row-major order
+        while candidates:
+            low = candidates & -candidates
+            eligible_idxs.append(low.bit_length() - 1)
+            candidates ^= low
+        
+        return eligible_idxs
     
     def find_eligible_ews(self, grid: Grid) -> List[Tuple[int, int]]:
         """
@@ -168,16 +385,7 @@ class ExplosionSystem:
         Returns:
             List of positions containing eligible EWs
         """
-        eligible_positions = []
-        
-        for row in range(ROWS):
-            for col in range(COLS):
-                pos = (row, col)
-                if (is_explosivo_wild(grid.get_symbol(row, col)) and 
-                    self.ew_tracker.is_eligible_to_explode(pos)):
-                    eligible_positions.append(pos)
-        
-        return eligible_positions
+        return [POSITIONS[idx] for idx in self.find_eligible_idxs(grid)]
     
     def execute_explosions(self, grid: Grid, eligible_ews: Optional[List[Tuple[int, int]]] = None) -> List[ExplosionEvent]:
         """
@@ -192,54 +400,40 @@ class ExplosionSystem:
         """
         # Find eligible EWs if not provided
         if eligible_ews is None:
-            eligible_ews = self.find_eligible_ews(grid)
+            ew_idxs = self.find_eligible_idxs(grid)
+        else:
+            ew_idxs = [EWTracker._idx(ew_pos) for ew_pos in eligible_ews]
         
-        if not eligible_ews:
+        if not ew_idxs:
             logger.debug("No eligible EWs to explode")
             return []
         
-        logger.info(f"Executing explosions for {len(eligible_ews)} EWs")
+        logger.info(f"Executing explosions for {len(ew_idxs)} EWs")
         
-        # Track all positions to be destroyed (use set to avoid duplicates)
-        positions_to_destroy = set()
-        explosion_events = []
+        tracker = self.ew_tracker
+        destroyed_masks, destroyed_all = _explosion_kernel(grid.cells().ravel(), ew_idxs)
+        exploded_mask = 0
+        for idx in ew_idxs:
+            exploded_mask |= 1 << idx
         
-        # Calculate all explosion areas first
-        for ew_pos in eligible_ews:
-            explosion_area = self.calculate_explosion_area(ew_pos)
-            destroyed_in_area = []
-            
-            # Check each position in explosion area
-            for pos in explosion_area:
-                symbol = grid.get_symbol(pos[0], pos[1])
-                
-                # Only destroy low-pay symbols
-                if is_low_pay(symbol):
-                    positions_to_destroy.add(pos)
-                    destroyed_in_area.append(pos)
-            
-            # Create explosion event
-            from_cluster = ew_pos in self.ew_tracker.in_winning_clusters
-            event = ExplosionEvent(
-                ew_position=ew_pos,
-                affected_area=explosion_area,
-                destroyed_positions=destroyed_in_area,
-                from_cluster=from_cluster
+        explosion_events = [
+            ExplosionEvent(
+                ew_index=idx,
+                destroyed_mask=destroyed,
+                from_cluster=bool(tracker.in_winning_mask >> idx & 1)
             )
-            explosion_events.append(event)
+            for idx, destroyed in zip(ew_idxs, destroyed_masks)
+        ]
         
-        # Apply all destructions simultaneously
-        for pos in positions_to_destroy:
-            grid.set_symbol(pos[0], pos[1], Symbol.EMPTY)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Destroyed {destroyed_all.bit_count()} symbols in explosions")
         
-        logger.info(f"Destroyed {len(positions_to_destroy)} symbols in explosions")
+        # Count non-cluster EWs as collected too (cluster EWs were counted
+        # when their cluster was tracked)
+        tracker.collected_count += (exploded_mask & ~tracker.in_winning_mask).bit_count()
         
-        # EWs that exploded are also destroyed
-        for ew_pos in eligible_ews:
-            grid.set_symbol(ew_pos[0], ew_pos[1], Symbol.EMPTY)
-            # Count non-cluster EWs as collected too
-            if ew_pos not in self.ew_tracker.in_winning_clusters:
-                self.ew_tracker.collected_count += 1
+        # Apply all destructions simultaneously, exploded EWs included
+        grid.set_mask(destroyed_all | exploded_mask, Symbol.EMPTY)
         
         return explosion_events
     
@@ -267,4 +461,17 @@ class ExplosionSystem:
     
     def reset_collected_count(self):
         """Reset the collected EW count (e.g., when entering free spins)."""
-        self.ew_tracker.collected_count = 0
\ No newline at end of file
+        self.ew_tracker.collected_count = 0
+    
+    def reset(self, preserve_collected: bool = False):
+        """
+        Return the system to its initial state in place.
+        
+        Reuses the existing tracker instead of building a new system.
+        
+        Args:
+            preserve_collected: Keep the collected EW count
+        """
+        self.ew_tracker.reset_cascade()
+        if not preserve_collected:
+            self.ew_tracker.collected_count = 0
\ No newline at end of file
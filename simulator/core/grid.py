@@ -5,12 +5,9 @@ This module provides the fundamental 5x5 grid system including the grid
 data structure, gravity mechanics, and symbol dropping functionality.
 """
 
-from typing import List, Tuple, Optional, Dict, Set
+from typing import Iterable, List, Tuple, Optional, Dict, Set
 import copy
-from simulator.core.symbol import (
-    Symbol, is_empty, get_display_string, from_config_string,
-    get_config_string
-)
+from simulator.core.symbol import Symbol, EMPTY_CODE, get_display_string, get_config_string
 from simulator.core.rng import SpinRNG
 from simulator import config
 import numpy as np
@@ -21,6 +18,83 @@ ROWS = 5
 COLS = 5
 TOTAL_POSITIONS = ROWS * COLS
 
+# Integer symbol codes stored in the grid's backing array
+_MIN_CODE = int(min(Symbol))
+_MAX_CODE = int(max(Symbol))
+_SYMBOL_BY_CODE: List[Optional[Symbol]] = [None] * (_MAX_CODE + 1)
+for _symbol in Symbol:
+    _SYMBOL_BY_CODE[_symbol] = _symbol
+del _symbol
+
+# Serialized state string of every code ("" for EMPTY) and its inverse
+_STATE_STRING_BY_CODE: List[str] = [
+    get_config_string(symbol) if symbol is not None and symbol != Symbol.EMPTY else ""
+    for symbol in _SYMBOL_BY_CODE
+]
+_CODE_BY_STATE_STRING: Dict[str, int] = {
+    state_str: code for code, state_str in enumerate(_STATE_STRING_BY_CODE)
+    if state_str or code == EMPTY_CODE
+}
+
+# Gravity lookup: for every 5-bit "non-empty" mask of a column (bit r set
+# when row r holds a symbol), the flat offset (source row * COLS) for each
+# destination row once the column has settled: empty rows first, then
+# filled rows in order. Adding the column gives the flat gather index.
+_ROW_WEIGHTS = 1 << np.arange(ROWS, dtype=np.intp)
+
+
+def _build_gravity_lut() -> np.ndarray:
+    lut = np.zeros((1 << ROWS, ROWS), dtype=np.intp)
+    for mask in range(1 << ROWS):
+        filled = [row for row in range(ROWS) if mask >> row & 1]
+        empty = [row for row in range(ROWS) if not mask >> row & 1]
+        lut[mask] = [row * COLS for row in empty + filled]
+    lut.flags.writeable = False
+    return lut
+
+
+_GRAVITY_LUT = _build_gravity_lut()
+# For every column mask, which rows are empty once the column has settled
+_SETTLED_EMPTY_LUT = np.arange(ROWS) < ROWS - np.array(
+    [bin(mask).count("1") for mask in range(1 << ROWS)]).reshape(-1, 1)
+_SETTLED_EMPTY_LUT.flags.writeable = False
+
+# Backing array of an empty grid; new grids start from a copy of it
+_EMPTY_SYMBOLS = np.full(TOTAL_POSITIONS, EMPTY_CODE, dtype=np.int8)
+_EMPTY_SYMBOLS.flags.writeable = False
+
+# Flat index of every (row, col); indexing past the end raises IndexError,
+# so together with a sign check it doubles as the bounds check
+_POS_LUT: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(row * COLS + col for col in range(COLS)) for row in range(ROWS)
+)
+_COL_RANGE = np.arange(COLS)
+
+# Bitboards: bit (row * COLS + col) represents cell (row, col). POSITIONS
+# maps each flat index back to its shared (row, col) tuple
+POSITIONS: Tuple[Tuple[int, int], ...] = tuple(divmod(idx, COLS) for idx in range(TOTAL_POSITIONS))
+
+
+def flags_to_mask(flags: np.ndarray) -> int:
+    """Pack a flat row-major boolean array of cells into a bitboard."""
+    return int.from_bytes(np.packbits(flags, bitorder='little').tobytes(), 'little')
+
+
+def mask_to_flags(mask: int) -> np.ndarray:
+    """Expand a bitboard into a flat row-major boolean array of cells."""
+    packed = np.frombuffer(mask.to_bytes(4, 'little'), dtype=np.uint8)
+    return np.unpackbits(packed, count=TOTAL_POSITIONS, bitorder='little').view(np.bool_)
+
+
+def mask_to_positions(mask: int) -> List[Tuple[int, int]]:
+    """List the (row, col) positions of a bitboard in row-major order."""
+    positions = []
+    while mask:
+        low = mask & -mask
+        positions.append(POSITIONS[low.bit_length() - 1])
+        mask ^= low
+    return positions
+
 
 class Grid:
     """
@@ -29,13 +103,18 @@ class Grid:
     The grid uses row-major ordering with positions indexed as:
     - Row 0-4 (top to bottom)
     - Column 0-4 (left to right)
+    
+    Symbols are stored as their integer codes (int(Symbol)) in a flat
+    int8 NumPy array, so whole grids can be loaded in a single copy.
     """
     
+    __slots__ = ('_symbols', '_cached_symbol_counts')
+    
     def __init__(self):
         """Initialize an empty 5x5 grid."""
-        # Using a flat list for better performance
+        # Flat int8 array of symbol codes
         # Position (row, col) maps to index: row * COLS + col
-        self._symbols: List[Symbol] = [Symbol.EMPTY] * TOTAL_POSITIONS
+        self._symbols: np.ndarray = _EMPTY_SYMBOLS.copy()
         self._cached_symbol_counts: Optional[Dict[Symbol, int]] = None
     
     def _invalidate_cache(self):
@@ -50,29 +129,127 @@ class Grid:
         """Convert flat index to (row, col) position."""
         return divmod(index, COLS)
     
-    def _validate_position(self, row: int, col: int) -> None:
-        """Validate that position is within grid bounds."""
-        if not (0 <= row < ROWS and 0 <= col < COLS):
-            raise ValueError(f"Position ({row}, {col}) out of bounds")
+    def cells(self) -> np.ndarray:
+        """
+        Get the backing symbol codes as a (ROWS, COLS) view, without copying.
+        
+        For reads on internal hot paths; tests and callers outside the core
+        should use get_symbol. Write through set_symbol, set_symbols,
+        set_batch or set_mask, which keep the cached counts current.
+        """
+        return self._symbols.reshape(ROWS, COLS)
     
     def get_symbol(self, row: int, col: int) -> Symbol:
         """Get symbol at specified position."""
-        self._validate_position(row, col)
-        return self._symbols[self._pos_to_index(row, col)]
+        try:
+            if row < 0 or col < 0:
+                raise IndexError
+            index = _POS_LUT[row][col]
+        except IndexError:
+            raise ValueError(f"Position ({row}, {col}) out of bounds") from None
+        return _SYMBOL_BY_CODE[self._symbols[index]]
     
     def set_symbol(self, row: int, col: int, symbol: Symbol) -> None:
         """Set symbol at specified position."""
-        self._validate_position(row, col)
-        self._symbols[self._pos_to_index(row, col)] = symbol
-        self._invalidate_cache()
+        try:
+            if row < 0 or col < 0:
+                raise IndexError
+            index = _POS_LUT[row][col]
+        except IndexError:
+            raise ValueError(f"Position ({row}, {col}) out of bounds") from None
+        self._symbols[index] = symbol
+        self._cached_symbol_counts = None
     
     def is_empty(self, row: int, col: int) -> bool:
         """Check if position is empty."""
-        return is_empty(self.get_symbol(row, col))
+        try:
+            if row < 0 or col < 0:
+                raise IndexError
+            index = _POS_LUT[row][col]
+        except IndexError:
+            raise ValueError(f"Position ({row}, {col}) out of bounds") from None
+        return self._symbols[index] == EMPTY_CODE
     
     def clear(self) -> None:
-        """Clear the entire grid."""
-        self._symbols = [Symbol.EMPTY] * TOTAL_POSITIONS
+        """Clear the entire grid in place, without reallocating its storage."""
+        self._symbols.fill(EMPTY_CODE)
+        self._invalidate_cache()
+    
+    # Reset the grid to empty in place; the same operation as clear()
+    reset = clear
+    
+    def fill(self, symbol: Symbol) -> None:
+        """Set every position on the grid to the same symbol."""
+        self._symbols.fill(symbol)
+        self._invalidate_cache()
+    
+    def fill_rect(self, row_start: int, row_stop: int,
+                  col_start: int, col_stop: int, symbol: Symbol) -> None:
+        """
+        Set a rectangular block of positions to the same symbol.
+        
+        Args:
+            row_start: First row of the block
+            row_stop: Row after the last row of the block
+            col_start: First column of the block
+            col_stop: Column after the last column of the block
+            symbol: Symbol to place
+        """
+        if not (0 <= row_start <= row_stop <= ROWS and 0 <= col_start <= col_stop <= COLS):
+            raise ValueError(
+                f"Block rows {row_start}:{row_stop}, cols {col_start}:{col_stop} out of bounds")
+        self.cells()[row_start:row_stop, col_start:col_stop] = symbol
+        self._invalidate_cache()
+    
+    def set_batch(self, indices: np.ndarray, codes: np.ndarray) -> None:
+        """
+        Set many positions in one scatter.
+        
+        Args:
+            indices: Flat position indices (row * COLS + col); when an index
+                repeats, the last write wins
+            codes: Symbol codes (int(Symbol)) to write, or a single code
+        """
+        indices = np.asarray(indices)
+        if indices.size and (indices.min() < 0 or indices.max() >= TOTAL_POSITIONS):
+            raise ValueError("Position index out of bounds")
+        codes = np.asarray(codes)
+        if codes.size and (codes.min() < _MIN_CODE or codes.max() > _MAX_CODE):
+            raise ValueError("Array contains invalid symbol codes")
+        self._symbols[indices] = codes
+        self._invalidate_cache()
+    
+    def set_mask(self, mask: int, symbol: Symbol) -> None:
+        """Set every cell whose bit (row * COLS + col) is set in mask to symbol."""
+        self._symbols[mask_to_flags(mask)] = symbol
+        self._invalidate_cache()
+    
+    def get_batch(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Get the symbol codes at many flat position indices in one gather.
+        
+        Returns:
+            New int8 array of symbol codes, one per index
+        """
+        indices = np.asarray(indices)
+        if indices.size and (indices.min() < 0 or indices.max() >= TOTAL_POSITIONS):
+            raise ValueError("Position index out of bounds")
+        return self._symbols[indices]
+    
+    def load_array(self, codes: np.ndarray) -> None:
+        """
+        Load the whole grid from an array of symbol codes in one copy.
+        
+        Args:
+            codes: Symbol codes (int(Symbol)) shaped (ROWS, COLS) or
+                (TOTAL_POSITIONS,), in row-major order
+        """
+        codes = np.asarray(codes)
+        if codes.size != TOTAL_POSITIONS:
+            raise ValueError(f"Invalid array size: {codes.size}")
+        if codes.min() < _MIN_CODE or codes.max() > _MAX_CODE:
+            raise ValueError("Array contains invalid symbol codes")
+        self._symbols[:] = codes.reshape(TOTAL_POSITIONS)
         self._invalidate_cache()
     
     def copy(self) -> 'Grid':
@@ -88,36 +265,42 @@ class Grid:
     def count_symbols(self) -> Dict[Symbol, int]:
         """Count occurrences of each symbol type."""
         if self._cached_symbol_counts is None:
-            counts = {}
-            for symbol in self._symbols:
-                counts[symbol] = counts.get(symbol, 0) + 1
-            self._cached_symbol_counts = counts
+            code_counts = np.bincount(self._symbols, minlength=_MAX_CODE + 1)
+            self._cached_symbol_counts = {
+                _SYMBOL_BY_CODE[code]: count
+                for code, count in enumerate(code_counts.tolist()) if count
+            }
         return self._cached_symbol_counts.copy()
     
     def count_symbol(self, symbol: Symbol) -> int:
         """Count occurrences of a specific symbol."""
-        return self.count_symbols().get(symbol, 0)
+        # Reuse the full tally if one is cached; otherwise one vectorized
+        # compare is cheaper than building and copying it. Comparing the
+        # array against a plain int, not the enum member, avoids NumPy's
+        # slow scalar conversion of IntEnum
+        counts = self._cached_symbol_counts
+        if counts is not None:
+            return counts.get(symbol, 0)
+        return int(np.count_nonzero(self._symbols == int(symbol)))
     
     def find_all_positions(self, symbol: Symbol) -> List[Tuple[int, int]]:
         """Find all positions containing a specific symbol."""
-        positions = []
-        for idx, sym in enumerate(self._symbols):
-            if sym == symbol:
-                positions.append(self._index_to_pos(idx))
-        return positions
+        indices = np.flatnonzero(self._symbols == int(symbol))
+        return [self._index_to_pos(idx) for idx in indices.tolist()]
     
     def get_column(self, col: int) -> List[Symbol]:
         """Get all symbols in a column (top to bottom)."""
         if not 0 <= col < COLS:
             raise ValueError(f"Column {col} out of bounds")
-        return [self._symbols[row * COLS + col] for row in range(ROWS)]
+        return [_SYMBOL_BY_CODE[code] for code in self._symbols[col::COLS].tolist()]
     
     def get_row(self, row: int) -> List[Symbol]:
         """Get all symbols in a row (left to right)."""
         if not 0 <= row < ROWS:
             raise ValueError(f"Row {row} out of bounds")
         start_idx = row * COLS
-        return self._symbols[start_idx:start_idx + COLS]
+        return [_SYMBOL_BY_CODE[code]
+                for code in self._symbols[start_idx:start_idx + COLS].tolist()]
     
     def apply_gravity(self) -> bool:
         """
@@ -126,51 +309,35 @@ class Grid:
         Returns:
             True if any symbols moved, False otherwise
         """
-        moved = False
+        cells = self.cells()
+        nonempty = cells != EMPTY_CODE
         
-        # Process each column independently
-        for col in range(COLS):
-            # Extract non-empty symbols from top to bottom (preserve order)
-            symbols = []
-            symbol_positions = []  # Track original positions
-            
-            for row in range(ROWS):
-                symbol = self.get_symbol(row, col)
-                if not is_empty(symbol):
-                    symbols.append(symbol)
-                    symbol_positions.append(row)
-            
-            # If no symbols or column is full, skip
-            if not symbols or len(symbols) == ROWS:
-                continue
-            
-            # Calculate where symbols should be after gravity
-            expected_positions = list(range(ROWS - len(symbols), ROWS))
-            
-            # Check if any symbol needs to move
-            if symbol_positions == expected_positions:
-                continue  # Already in correct positions
-            
-            # Clear the column and place symbols at bottom
-            for row in range(ROWS):
-                self._symbols[self._pos_to_index(row, col)] = Symbol.EMPTY
-            
-            # Place symbols from bottom
-            for i, symbol in enumerate(symbols):
-                self._symbols[self._pos_to_index(expected_positions[i], col)] = symbol
-            
-            self._invalidate_cache()
-            moved = True
+        # Something falls only where a symbol sits directly above a gap;
+        # full or already settled boards return without sorting
+        if not (nonempty[:-1] & ~nonempty[1:]).any():
+            return False
         
-        return moved
+        self._settle_columns(nonempty)
+        self._invalidate_cache()
+        return True
     
-    def _count_empty_in_column(self, col: int) -> int:
-        """Count empty positions in a column."""
-        count = 0
-        for row in range(ROWS):
-            if is_empty(self.get_symbol(row, col)):
-                count += 1
-        return count
+    def _settle_columns(self, nonempty: np.ndarray) -> np.ndarray:
+        """
+        Let every column fall with one table lookup and one flat gather.
+        
+        Empties rise to the top and the remaining symbols keep their
+        relative order. The caller invalidates the count cache.
+        
+        Args:
+            nonempty: (ROWS, COLS) boolean array of occupied cells
+            
+        Returns:
+            The 5-bit non-empty mask of each column before settling
+        """
+        masks = _ROW_WEIGHTS @ nonempty
+        symbols = self._symbols
+        symbols[:] = symbols[(_GRAVITY_LUT[masks].T + _COL_RANGE).ravel()]
+        return masks
     
     def drop_new_symbols(self, rng: SpinRNG, is_free_spins: bool = False) -> int:
         """
@@ -183,6 +350,38 @@ class Grid:
         Returns:
             Number of symbols dropped
         """
+        # Empty cells in fill order: top to bottom within each column,
+        # columns left to right
+        cols, rows = np.nonzero(self.cells().T == EMPTY_CODE)
+        return self._drop_into(rows, cols, rng, is_free_spins)
+    
+    def settle_and_drop(self, rng: SpinRNG, is_free_spins: bool = False) -> int:
+        """
+        Apply gravity and refill the gaps in one pass over the grid.
+        
+        Equivalent to apply_gravity() followed by drop_new_symbols(), with the
+        same draws, but the column masks that drive gravity also give the
+        cells left empty, so the grid is scanned once.
+        
+        Args:
+            rng: Random number generator
+            is_free_spins: Whether to use free spins weights
+            
+        Returns:
+            Number of symbols dropped
+        """
+        masks = self._settle_columns(self.cells() != EMPTY_CODE)
+        cols, rows = np.nonzero(_SETTLED_EMPTY_LUT[masks])
+        self._invalidate_cache()
+        return self._drop_into(rows, cols, rng, is_free_spins)
+    
+    def _drop_into(self, rows: np.ndarray, cols: np.ndarray,
+                   rng: SpinRNG, is_free_spins: bool) -> int:
+        """Fill the given empty cells, in order, with weighted random symbols."""
+        dropped = len(rows)
+        if not dropped:
+            return 0
+        
         # Choose appropriate weights
         if is_free_spins:
             symbol_names = config.FS_SYMBOL_NAMES
@@ -191,25 +390,52 @@ class Grid:
             symbol_names = config.BG_SYMBOL_NAMES
             weights = config.BG_WEIGHTS
         
-        dropped = 0
-        
-        # Fill empty positions from top to bottom in each column
-        for col in range(COLS):
-            for row in range(ROWS):
-                if is_empty(self.get_symbol(row, col)):
-                    # Generate new symbol using weighted choice
-                    config_str = rng.weighted_choice_numpy(symbol_names, weights)
-                    symbol = from_config_string(config_str)
-                    if symbol:
-                        self.set_symbol(row, col, symbol)
-                        dropped += 1
+        # One uniform per cell, in the same order as one weighted choice
+        # per cell, then a single inverse-CDF lookup for the whole batch
+        symbol_codes = np.array([_CODE_BY_STATE_STRING[name] for name in symbol_names],
+                                dtype=np.int8)
+        self.cells()[rows, cols] = rng.weighted_choice_numpy_batch(symbol_codes, weights, dropped)
+        self._invalidate_cache()
         
         return dropped
     
-    def remove_positions(self, positions: List[Tuple[int, int]]) -> None:
-        """Remove symbols at specified positions (set to empty)."""
+    def set_symbols(self, positions: Iterable[Tuple[int, int]], symbol: Symbol) -> None:
+        """
+        Set every (row, col) in positions to the same symbol.
+        
+        Args:
+            positions: (row, col) pairs, or an integer array of shape (n, 2)
+                which is written in one vectorized scatter
+            symbol: Symbol to write
+        """
+        if isinstance(positions, np.ndarray):
+            rows, cols = positions.reshape(-1, 2).T
+            if rows.size and (min(rows.min(), cols.min()) < 0
+                              or rows.max() >= ROWS or cols.max() >= COLS):
+                raise ValueError("Position out of bounds")
+            self.cells()[rows, cols] = symbol
+            self._invalidate_cache()
+            return
+        
+        # Direct stores into the backing array; for the handful of cells a
+        # cluster covers this beats building an index array to scatter.
+        # Every position is checked first so a bad one leaves the grid as is
+        positions = list(positions)
+        for row, col in positions:
+            if not (0 <= row < ROWS and 0 <= col < COLS):
+                raise ValueError(f"Position ({row}, {col}) out of bounds")
+        symbols = self._symbols
         for row, col in positions:
-            self.set_symbol(row, col, Symbol.EMPTY)
+            symbols[row * COLS + col] = symbol
+        self._invalidate_cache()
+    
+    def remove_positions(self, positions: Iterable[Tuple[int, int]]) -> None:
+        """
+        Remove symbols at specified positions (set to empty).
+        
+        Accepts (row, col) pairs or an (n, 2) integer array, as set_symbols.
+        """
+        self.set_symbols(positions, EMPTY_CODE)
     
     def to_string(self, show_coordinates: bool = True) -> str:
         """
@@ -276,26 +502,46 @@ class Grid:
         if len(self._symbols) != TOTAL_POSITIONS:
             return False
         
-        # Check all positions contain valid symbols
-        for symbol in self._symbols:
-            if not isinstance(symbol, Symbol):
-                return False
+        # Check all positions contain valid symbol codes
+        return bool(self._symbols.min() >= _MIN_CODE and self._symbols.max() <= _MAX_CODE)
+    
+    def to_state(self) -> bytes:
+        """
+        Serialize grid state to one symbol-code byte per position.
         
-        return True
+        Returns:
+            TOTAL_POSITIONS bytes in row-major order
+        """
+        return self._symbols.tobytes()
+    
+    def from_state(self, state: bytes) -> None:
+        """
+        Restore grid from serialized state.
+        
+        Args:
+            state: Bytes produced by to_state()
+        """
+        if len(state) != TOTAL_POSITIONS:
+            raise ValueError(f"Invalid state size: {len(state)}")
+        # Codes are small non-negative ints, so a byte above the largest
+        # code (including any negative int8) is invalid
+        if max(state) > _MAX_CODE:
+            raise ValueError("State contains invalid symbol codes")
+        self._symbols[:] = np.frombuffer(state, dtype=np.int8)
+        self._invalidate_cache()
     
-    def to_state(self) -> List[str]:
+    def to_state_names(self) -> List[str]:
         """
         Serialize grid state to list of symbol strings.
         
         Returns:
             List of symbol configuration strings
         """
-        return [get_config_string(sym) if sym != Symbol.EMPTY else "" 
-                for sym in self._symbols]
+        return [_STATE_STRING_BY_CODE[code] for code in self._symbols.tolist()]
     
-    def from_state(self, state: List[str]) -> None:
+    def from_state_names(self, state: List[str]) -> None:
         """
-        Restore grid from serialized state.
+        Restore grid from a list of symbol strings.
         
         Args:
             state: List of symbol configuration strings
@@ -303,19 +549,14 @@ class Grid:
         if len(state) != TOTAL_POSITIONS:
             raise ValueError(f"Invalid state size: {len(state)}")
         
-        self._symbols = []
-        for config_str in state:
-            if config_str:
-                symbol = from_config_string(config_str)
-                if symbol is None:
-                    raise ValueError(f"Invalid symbol string: {config_str}")
-                self._symbols.append(symbol)
-            else:
-                self._symbols.append(Symbol.EMPTY)
+        try:
+            codes = [_CODE_BY_STATE_STRING[config_str] for config_str in state]
+        except KeyError as exc:
+            raise ValueError(f"Invalid symbol string: {exc.args[0]}") from None
         
+        self._symbols[:] = codes
         self._invalidate_cache()
 
-
 def create_test_grid() -> Grid:
     """Create a test grid with some symbols for testing."""
     grid = Grid()
@@ -6,11 +6,71 @@ to ensure controlled, deterministic randomness throughout the simulation.
 """
 
 import random
-from typing import TypeVar, List, Optional, Sequence
+from functools import lru_cache
+from typing import TypeVar, List, Optional, Sequence, Tuple
 import numpy as np
 
 T = TypeVar('T')
 
+# Batches at least this large are drawn by NumPy's MT19937 from a copy of
+# the Python generator's state; below it the state hand-off costs more than
+# drawing in a Python loop
+_NUMPY_BATCH_MIN = 4096
+
+
+def _mt19937_batch(rng: random.Random, n: int) -> np.ndarray:
+    """
+    Draw n floats from a random.Random's Mersenne Twister stream in C.
+    
+    NumPy's MT19937 builds doubles exactly like random.Random.random(), so
+    after copying the 624-word state across, Generator.random(n) yields the
+    same values as n Python calls. The advanced state is copied back.
+    """
+    version, internal, gauss_next = rng.getstate()
+    bit_generator = np.random.MT19937()
+    bit_generator.state = {
+        'bit_generator': 'MT19937',
+        'state': {'key': np.array(internal[:-1], dtype=np.uint32), 'pos': internal[-1]},
+    }
+    out = np.random.Generator(bit_generator).random(n)
+    advanced = bit_generator.state['state']
+    rng.setstate((version, tuple(advanced['key'].tolist()) + (int(advanced['pos']),),
+                  gauss_next))
+    return out
+
+
+@lru_cache(maxsize=128)
+def _prep_weights(weights: Tuple[float, ...]) -> np.ndarray:
+    """
+    Validate a weight table and return its cumulative sums.
+    
+    Weight tables are reused for every draw, so the result is cached per
+    distinct tuple and marked read-only.
+    
+    Raises:
+        ValueError: If any weight is negative or no weight is positive
+    """
+    cumsum = np.cumsum(weights)
+    if any(w < 0 for w in weights):
+        raise ValueError("Weights must be non-negative")
+    if cumsum[-1] <= 0:
+        raise ValueError("At least one weight must be positive")
+    cumsum.flags.writeable = False
+    return cumsum
+
+
+@lru_cache(maxsize=32)
+def _prep_probabilities(weights: bytes) -> np.ndarray:
+    """
+    Cumulative probabilities for a float64 weight vector, keyed by its bytes.
+    
+    The raw buffer is a cheap, exact cache key for the NumPy weight arrays
+    that weighted_choice_numpy receives on every draw.
+    """
+    cumsum = np.cumsum(np.frombuffer(weights, dtype=np.float64))
+    cumsum.flags.writeable = False
+    return cumsum
+
 
 class SpinRNG:
     """
@@ -44,6 +104,25 @@ class SpinRNG:
         self._call_count += 1
         return self._rng.random()
     
+    def random_batch(self, n: int) -> np.ndarray:
+        """
+        Generate n random floats in [0.0, 1.0) as one array.
+        
+        Draws come from the same stream as random(), so a batch is identical
+        to n consecutive random() calls.
+        
+        Args:
+            n: Number of values to draw
+            
+        Returns:
+            Float64 array of length n
+        """
+        self._call_count += n
+        if n >= _NUMPY_BATCH_MIN:
+            return _mt19937_batch(self._rng, n)
+        draw = self._rng.random
+        return np.fromiter((draw() for _ in range(n)), dtype=np.float64, count=n)
+    
     def randint(self, a: int, b: int) -> int:
         """
         Generate a random integer in [a, b] (inclusive).
@@ -94,26 +173,13 @@ class SpinRNG:
             raise ValueError("Choices and weights must have same length")
         if not choices:
             raise ValueError("Cannot choose from empty choices")
-        if any(w < 0 for w in weights):
-            raise ValueError("Weights must be non-negative")
-        if sum(weights) <= 0:
-            raise ValueError("At least one weight must be positive")
+        cumsum = _prep_weights(tuple(weights))
         
         self._call_count += 1
-        # Use cumulative distribution for efficiency
-        cumsum = []
-        total = 0
-        for w in weights:
-            total += w
-            cumsum.append(total)
-        
-        r = self.random() * total
-        for i, threshold in enumerate(cumsum):
-            if r <= threshold:
-                return choices[i]
-        
-        # Fallback (should never reach here)
-        return choices[-1]
+        # First index whose cumulative weight reaches r
+        r = self.random() * cumsum[-1]
+        idx = int(np.searchsorted(cumsum, r))
+        return choices[min(idx, len(choices) - 1)]
     
     def weighted_choice_numpy(self, choices: np.ndarray, weights: np.ndarray) -> str:
         """
@@ -129,10 +195,32 @@ class SpinRNG:
         self._call_count += 1
         # np.random.choice doesn't use our RNG, so we implement manually
         r = self.random()
-        cumsum = np.cumsum(weights)
+        cumsum = _prep_probabilities(np.asarray(weights, dtype=np.float64).tobytes())
         idx = np.searchsorted(cumsum, r)
         return choices[idx]
     
+    def weighted_choice_numpy_batch(self, choices: np.ndarray, weights: np.ndarray,
+                                    n: int) -> np.ndarray:
+        """
+        Draw n weighted choices at once.
+        
+        Consumes the same uniforms, in the same order, as n calls to
+        weighted_choice_numpy, so results and the call count are identical
+        to the per-call loop.
+        
+        Args:
+            choices: NumPy array of choices
+            weights: NumPy array of normalized weights (must sum to 1.0)
+            n: Number of draws
+            
+        Returns:
+            Array of n chosen elements
+        """
+        # One count per choice, on top of the n uniforms random_batch counts
+        self._call_count += n
+        cumsum = _prep_probabilities(np.asarray(weights, dtype=np.float64).tobytes())
+        return np.asarray(choices)[np.searchsorted(cumsum, self.random_batch(n))]
+    
     def shuffle(self, seq: List[T]) -> None:
         """
         Shuffle a list in-place.
@@ -170,6 +258,25 @@ class SpinRNG:
         self._rng.setstate(state)
 
 
+def worker_seed(base_seed: int, worker_id: int) -> int:
+    """
+    Seed used by create_worker_rng for a given worker.
+    
+    A pure function of its arguments, so a coordinator can hand out or
+    check every worker's seed without building the RNGs.
+    
+    Args:
+        base_seed: Base seed for the simulation run
+        worker_id: Unique identifier for the worker
+        
+    Returns:
+        Deterministic per-worker seed
+    """
+    # Simple deterministic formula that avoids correlation
+    # Using prime multiplier to reduce patterns
+    return base_seed + (worker_id * 1000003)
+
+
 def create_worker_rng(base_seed: int, worker_id: int) -> SpinRNG:
     """
     Create a deterministic RNG for a parallel worker.
@@ -186,10 +293,7 @@ def create_worker_rng(base_seed: int, worker_id: int) -> SpinRNG:
     Returns:
         SpinRNG instance with deterministic seed
     """
-    # Simple deterministic formula that avoids correlation
-    # Using prime multiplier to reduce patterns
-    worker_seed = base_seed + (worker_id * 1000003)
-    return SpinRNG(worker_seed)
+    return SpinRNG(worker_seed(base_seed, worker_id))
 
 
 def verify_determinism(seed: int, operations: int = 1000) -> List[float]:
@@ -203,10 +307,4 @@ def verify_determinism(seed: int, operations: int = 1000) -> List[float]:
     Returns:
         List of generated random values
     """
-    rng = SpinRNG(seed)
-    results = []
-    
-    for _ in range(operations):
-        results.append(rng.random())
-    
-    return results
\ No newline at end of file
+    return SpinRNG(seed).random_batch(operations).tolist()
\ No newline at end of file
@@ -5,32 +5,37 @@ This module defines all symbols, their properties, and utility functions
 for symbol type checking and manipulation.
 """
 
-from enum import Enum, auto
-from typing import Set, Optional
+from enum import IntEnum
+from typing import FrozenSet, Optional, Tuple
 
 
-class Symbol(Enum):
-    """Enumeration of all symbols in the game."""
+class Symbol(IntEnum):
+    """
+    Enumeration of all symbols in the game.
+    
+    Values are the integer codes stored in the grid, so symbols compare
+    and hash as plain ints and can be written straight into int8 arrays.
+    """
     
     # Empty position
-    EMPTY = auto()
+    EMPTY = 0
     
     # High Pay Symbol
-    LADY_SK = auto()  # Lady Skull (Red)
+    LADY_SK = 1  # Lady Skull (Red)
     
     # Low Pay Symbols
-    PINK_SK = auto()   # Pink Skull (Magenta)
-    GREEN_SK = auto()  # Green Skull (Green)
-    BLUE_SK = auto()   # Blue Skull (Blue)
-    ORANGE_SK = auto() # Orange Skull (Yellow)
-    CYAN_SK = auto()   # Cyan Skull (Cyan)
+    PINK_SK = 2    # Pink Skull (Magenta)
+    GREEN_SK = 3   # Green Skull (Green)
+    BLUE_SK = 4    # Blue Skull (Blue)
+    ORANGE_SK = 5  # Orange Skull (Yellow)
+    CYAN_SK = 6    # Cyan Skull (Cyan)
     
     # Wild Symbols
-    WILD = auto()      # Regular Wild (White)
-    E_WILD = auto()    # Explosivo Wild (Bright Yellow)
+    WILD = 7       # Regular Wild (White)
+    E_WILD = 8     # Explosivo Wild (Bright Yellow)
     
     # Special Symbol
-    SCATTER = auto()   # Scatter (Bright Magenta)
+    SCATTER = 9    # Scatter (Bright Magenta)
 
 
 # Symbol display mappings for visualization
@@ -63,16 +68,46 @@ SYMBOL_TO_STRING = {
 # String to symbol mapping (reverse of above)
 STRING_TO_SYMBOL = {v: k for k, v in SYMBOL_TO_STRING.items()}
 
-# Symbol categories
-HIGH_PAY_SYMBOLS: Set[Symbol] = {Symbol.LADY_SK}
-LOW_PAY_SYMBOLS: Set[Symbol] = {
-    Symbol.PINK_SK, Symbol.GREEN_SK, Symbol.BLUE_SK,
-    Symbol.ORANGE_SK, Symbol.CYAN_SK
-}
-PAYING_SYMBOLS: Set[Symbol] = HIGH_PAY_SYMBOLS | LOW_PAY_SYMBOLS
-WILD_SYMBOLS: Set[Symbol] = {Symbol.WILD, Symbol.E_WILD}
-SPECIAL_SYMBOLS: Set[Symbol] = {Symbol.SCATTER}
-ALL_SYMBOLS: Set[Symbol] = PAYING_SYMBOLS | WILD_SYMBOLS | SPECIAL_SYMBOLS
+# Config strings for every symbol, so lookups never need a fallback
+_CONFIG_STRING = {Symbol.EMPTY: "", **SYMBOL_TO_STRING}
+
+# Symbol categories as bitmasks: bit int(symbol) is set for every member.
+# `(MASK >> codes) & 1` tests a whole array of grid codes at once; for a
+# single symbol the frozensets below are the faster membership test
+HIGH_PAY_MASK = 1 << Symbol.LADY_SK
+LOW_PAY_MASK = (1 << Symbol.PINK_SK | 1 << Symbol.GREEN_SK | 1 << Symbol.BLUE_SK
+                | 1 << Symbol.ORANGE_SK | 1 << Symbol.CYAN_SK)
+PAYING_MASK = HIGH_PAY_MASK | LOW_PAY_MASK
+WILD_MASK = 1 << Symbol.WILD | 1 << Symbol.E_WILD
+SPECIAL_MASK = 1 << Symbol.SCATTER
+ALL_MASK = PAYING_MASK | WILD_MASK | SPECIAL_MASK
+
+
+def _symbols_in(mask: int) -> FrozenSet[Symbol]:
+    """Members of a category bitmask as a frozenset."""
+    return frozenset(symbol for symbol in Symbol if mask >> symbol & 1)
+
+
+# Symbol categories as sets, built from the masks (fixed at import)
+HIGH_PAY_SYMBOLS: FrozenSet[Symbol] = _symbols_in(HIGH_PAY_MASK)
+LOW_PAY_SYMBOLS: FrozenSet[Symbol] = _symbols_in(LOW_PAY_MASK)
+PAYING_SYMBOLS: FrozenSet[Symbol] = _symbols_in(PAYING_MASK)
+WILD_SYMBOLS: FrozenSet[Symbol] = _symbols_in(WILD_MASK)
+SPECIAL_SYMBOLS: FrozenSet[Symbol] = _symbols_in(SPECIAL_MASK)
+ALL_SYMBOLS: FrozenSet[Symbol] = _symbols_in(ALL_MASK)
+# Symbols that survive an explosion (high-pay, wilds including EWs, scatters)
+PRESERVED_SYMBOLS: FrozenSet[Symbol] = _symbols_in(ALL_MASK & ~LOW_PAY_MASK)
+# Symbols that can be part of a cluster
+_CLUSTER_SYMBOLS: FrozenSet[Symbol] = _symbols_in(PAYING_MASK | WILD_MASK)
+
+# Integer codes of the low-pay symbols, for indexing lookup tables
+LOW_PAY_CODES: Tuple[int, ...] = tuple(sorted(int(symbol) for symbol in LOW_PAY_SYMBOLS))
+
+# Integer codes of single symbols, for comparing against code arrays
+# (NumPy converts IntEnum scalars slowly)
+EMPTY_CODE = int(Symbol.EMPTY)
+SCATTER_CODE = int(Symbol.SCATTER)
+E_WILD_CODE = int(Symbol.E_WILD)
 
 
 def is_empty(symbol: Symbol) -> bool:
@@ -125,7 +160,7 @@ def can_be_destroyed_by_explosion(symbol: Symbol) -> bool:
     Check if symbol can be destroyed by explosivo wild explosion.
     Only low-pay symbols can be destroyed.
     """
-    return is_low_pay(symbol)
+    return symbol in LOW_PAY_SYMBOLS
 
 
 def can_substitute(wild: Symbol, target: Symbol) -> bool:
@@ -133,9 +168,7 @@ def can_substitute(wild: Symbol, target: Symbol) -> bool:
     Check if a wild symbol can substitute for a target symbol.
     Wilds can substitute for all paying symbols but not scatters.
     """
-    if not is_wild(wild):
-        return False
-    return is_paying(target)
+    return wild in WILD_SYMBOLS and target in PAYING_SYMBOLS
 
 
 def get_display_string(symbol: Symbol) -> str:
@@ -145,7 +178,7 @@ def get_display_string(symbol: Symbol) -> str:
 
 def get_config_string(symbol: Symbol) -> str:
     """Get the configuration string key for a symbol."""
-    return SYMBOL_TO_STRING.get(symbol, "")
+    return _CONFIG_STRING.get(symbol, "")
 
 
 def from_config_string(config_str: str) -> Optional[Symbol]:
@@ -153,6 +186,27 @@ def from_config_string(config_str: str) -> Optional[Symbol]:
     return STRING_TO_SYMBOL.get(config_str)
 
 
+def _match_rule(symbol1: Symbol, symbol2: Symbol) -> bool:
+    """Cluster matching rule, evaluated once per pair to build _MATCH_TABLE."""
+    # Empty positions and scatters don't participate in clusters
+    if symbol1 not in _CLUSTER_SYMBOLS or symbol2 not in _CLUSTER_SYMBOLS:
+        return False
+    
+    # A wild matches any paying symbol or other wild
+    if symbol1 in WILD_SYMBOLS or symbol2 in WILD_SYMBOLS:
+        return True
+    
+    # Two paying symbols match only if they're the same type
+    return symbol1 == symbol2
+
+
+# _MATCH_TABLE[a][b] is whether symbol codes a and b can share a cluster;
+# nested tuples index faster than branching or a NumPy lookup
+_MATCH_TABLE: Tuple[Tuple[bool, ...], ...] = tuple(
+    tuple(_match_rule(symbol1, symbol2) for symbol2 in Symbol) for symbol1 in Symbol
+)
+
+
 def symbols_match_for_cluster(symbol1: Symbol, symbol2: Symbol) -> bool:
     """
     Check if two symbols can form a cluster together.
@@ -160,26 +214,4 @@ def symbols_match_for_cluster(symbol1: Symbol, symbol2: Symbol) -> bool:
     Wilds match with any paying symbol or other wilds.
     Scatters don't match with anything.
     """
-    # Empty positions don't match
-    if is_empty(symbol1) or is_empty(symbol2):
-        return False
-    
-    # Scatters don't participate in clusters
-    if is_scatter(symbol1) or is_scatter(symbol2):
-        return False
-    
-    # If both are wilds, they match
-    if is_wild(symbol1) and is_wild(symbol2):
-        return True
-    
-    # If one is wild and other is paying, they match
-    if is_wild(symbol1) and is_paying(symbol2):
-        return True
-    if is_wild(symbol2) and is_paying(symbol1):
-        return True
-    
-    # Two paying symbols match only if they're the same type
-    if is_paying(symbol1) and is_paying(symbol2):
-        return symbol1 == symbol2
-    
-    return False
\ No newline at end of file
+    return _MATCH_TABLE[symbol1][symbol2]
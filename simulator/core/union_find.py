@@ -6,6 +6,12 @@ designed for the 5x5 grid cluster detection in Esqueleto Explosivo 3.
 """
 
 from typing import List, Set, Dict
+import numpy as np
+
+
+# Element count from which whole-structure queries resolve every root with
+# NumPy pointer jumping; below it, per-element find() calls are cheaper
+_NUMPY_ROOTS_MIN = 128
 
 
 class UnionFind:
@@ -32,7 +38,7 @@ class UnionFind:
         """
         Find the root of the set containing element x.
         
-        Uses path compression to flatten the tree structure,
+        Uses path halving to flatten the tree structure,
         ensuring near O(1) amortized complexity.
         
         Args:
@@ -41,10 +47,13 @@ class UnionFind:
         Returns:
             Root element of the set containing x
         """
-        if self.parent[x] != x:
-            # Path compression: make all nodes point directly to root
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        parent = self.parent
+        while parent[x] != x:
+            # Path halving: point every other node on the path at its
+            # grandparent, iteratively instead of recursing to the root
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
     
     def union(self, x: int, y: int) -> bool:
         """
@@ -59,21 +68,28 @@ class UnionFind:
         Returns:
             True if sets were merged, False if already in same set
         """
-        root_x = self.find(x)
-        root_y = self.find(y)
+        # Both finds inlined (path halving), as union runs once per edge
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        while parent[y] != y:
+            parent[y] = parent[parent[y]]
+            y = parent[y]
         
-        if root_x == root_y:
+        if x == y:
             return False  # Already in same set
         
         # Union by rank: attach smaller tree under larger tree
-        if self.rank[root_x] < self.rank[root_y]:
-            self.parent[root_x] = root_y
-        elif self.rank[root_x] > self.rank[root_y]:
-            self.parent[root_y] = root_x
+        rank = self.rank
+        if rank[x] < rank[y]:
+            parent[x] = y
+        elif rank[x] > rank[y]:
+            parent[y] = x
         else:
             # Same rank: attach y to x and increment x's rank
-            self.parent[root_y] = root_x
-            self.rank[root_x] += 1
+            parent[y] = x
+            rank[x] += 1
         
         self._num_sets -= 1
         return True
@@ -97,9 +113,8 @@ class UnionFind:
         
         Efficient reset for reuse without reallocation.
         """
-        for i in range(self.size):
-            self.parent[i] = i
-            self.rank[i] = 0
+        self.parent[:] = range(self.size)
+        self.rank[:] = [0] * self.size
         self._num_sets = self.size
     
     def get_sets(self) -> Dict[int, List[int]]:
@@ -109,14 +124,14 @@ class UnionFind:
         Returns:
             Dictionary mapping root elements to lists of elements in each set
         """
-        sets: Dict[int, List[int]] = {}
-        
-        for i in range(self.size):
-            root = self.find(i)
-            if root not in sets:
-                sets[root] = []
-            sets[root].append(i)
+        if self.size >= _NUMPY_ROOTS_MIN:
+            roots = self._root_array().tolist()
+        else:
+            roots = map(self.find, range(self.size))
         
+        sets: Dict[int, List[int]] = {}
+        for i, root in enumerate(roots):
+            sets.setdefault(root, []).append(i)
         return sets
     
     def get_set_size(self, x: int) -> int:
@@ -129,12 +144,7 @@ class UnionFind:
         Returns:
             Size of the set containing x
         """
-        root = self.find(x)
-        count = 0
-        for i in range(self.size):
-            if self.find(i) == root:
-                count += 1
-        return count
+        return len(self.get_set_members(x))
     
     def num_sets(self) -> int:
         """
@@ -155,34 +165,59 @@ class UnionFind:
         Returns:
             List of all elements in the same set as x
         """
-        root = self.find(x)
-        members = []
-        for i in range(self.size):
-            if self.find(i) == root:
-                members.append(i)
-        return members
+        if self.size >= _NUMPY_ROOTS_MIN:
+            roots = self._root_array()
+            return np.flatnonzero(roots == roots[x]).tolist()
+        
+        find = self.find
+        root = find(x)
+        return [i for i in range(self.size) if find(i) == root]
+    
+    def _root_array(self) -> np.ndarray:
+        """
+        Get the root of every element as an array, without compressing paths.
+        
+        Pointer jumping: each step replaces every element's parent with its
+        grandparent, so it finishes in O(log depth) vectorized steps.
+        """
+        roots = np.array(self.parent, dtype=np.intp)
+        while True:
+            jumped = roots[roots]
+            if np.array_equal(jumped, roots):
+                return roots
+            roots = jumped
+
+
+# (row, col) of every linear index of the 5x5 grid
+_GRID_POSITIONS = tuple(divmod(index, 5) for index in range(25))
 
 
 class GridUnionFind(UnionFind):
     """
     Specialized Union-Find for 5x5 grid operations.
     
-    Provides grid-specific helper methods for cluster detection.
+    Provides grid-specific helper methods for cluster detection. Position
+    to index conversion is inlined as row * 5 + col in the hot methods.
     """
     
+    ROWS = 5
+    COLS = 5
+    
     def __init__(self):
         """Initialize for 5x5 grid (25 positions)."""
-        super().__init__(25)
-        self.rows = 5
-        self.cols = 5
+        super().__init__(self.ROWS * self.COLS)
+        self.rows = self.ROWS
+        self.cols = self.COLS
     
-    def _pos_to_index(self, row: int, col: int) -> int:
+    @staticmethod
+    def _pos_to_index(row: int, col: int) -> int:
         """Convert grid position to linear index."""
-        return row * self.cols + col
+        return row * 5 + col
     
-    def _index_to_pos(self, index: int) -> tuple[int, int]:
+    @staticmethod
+    def _index_to_pos(index: int) -> tuple[int, int]:
         """Convert linear index to grid position."""
-        return divmod(index, self.cols)
+        return _GRID_POSITIONS[index]
     
     def union_positions(self, row1: int, col1: int, row2: int, col2: int) -> bool:
         """
@@ -195,13 +230,11 @@ class GridUnionFind(UnionFind):
         Returns:
             True if positions were merged
         """
-        idx1 = self._pos_to_index(row1, col1)
-        idx2 = self._pos_to_index(row2, col2)
-        return self.union(idx1, idx2)
+        return self.union(row1 * 5 + col1, row2 * 5 + col2)
     
     def find_position(self, row: int, col: int) -> int:
         """Find root of grid position."""
-        return self.find(self._pos_to_index(row, col))
+        return self.find(row * 5 + col)
     
     def get_cluster_positions(self, row: int, col: int) -> List[tuple[int, int]]:
         """
@@ -213,6 +246,5 @@ class GridUnionFind(UnionFind):
         Returns:
             List of (row, col) tuples in the same cluster
         """
-        index = self._pos_to_index(row, col)
-        members = self.get_set_members(index)
-        return [self._index_to_pos(idx) for idx in members]
\ No newline at end of file
+        positions = _GRID_POSITIONS
+        return [positions[idx] for idx in self.get_set_members(row * 5 + col)]
\ No newline at end of file
@@ -9,10 +9,11 @@ each winning cluster is removed. Features include:
 - Collision handling for multiple simultaneous spawns
 """
 
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
-from simulator.core.symbol import Symbol
-from simulator.core.grid import Grid
+import numpy as np
+from simulator.core.symbol import Symbol, EMPTY_CODE
+from simulator.core.grid import Grid, COLS, flags_to_mask
 from simulator.core.clusters import Cluster
 from simulator.core.rng import SpinRNG
 import logging
@@ -75,37 +76,112 @@ class WildSpawningSystem:
         if not clusters:
             return []
         
+        # Bitboard of empty cells (bit row * COLS + col), read from the grid
+        # once; each spawn clears its bit so later clusters cannot claim it
+        free_mask = flags_to_mask(grid.cells().ravel() == EMPTY_CODE)
+        
+        # A lone cluster has nothing to collide with
+        if len(clusters) == 1:
+            return [self._spawn_one(grid, 0, clusters[0], free_mask, rng)]
+        
         spawn_attempts = []
-        occupied_positions = set()
         
         # Process each cluster in order (deterministic for reproducibility)
         for cluster_id, cluster in enumerate(clusters):
-            # Create spawn attempt for this cluster
-            spawn = self._create_spawn_attempt(cluster_id, cluster, rng)
+            spawn = self._spawn_one(grid, cluster_id, cluster, free_mask, rng)
+            if spawn.success:
+                row, col = spawn.spawned_position
+                free_mask &= ~(1 << (row * COLS + col))
+            spawn_attempts.append(spawn)
+        
+        return spawn_attempts
+    
+    def _spawn_one(
+        self, 
+        grid: Grid, 
+        cluster_id: int, 
+        cluster: Cluster, 
+        free_mask: int, 
+        rng: SpinRNG
+    ) -> WildSpawn:
+        """
+        Draw and place the wild for a single cluster.
+        
+        Args:
+            grid: Current game grid (after cluster removal)
+            cluster_id: Index of the cluster in this spawn round
+            cluster: The winning cluster
+            free_mask: Bitboard of positions still empty and unclaimed
+            rng: Random number generator for spawn decisions
             
-            # Try to place the wild
-            success = self._place_wild(
-                grid, 
-                spawn, 
-                occupied_positions, 
-                rng
+        Returns:
+            The WildSpawn record for this cluster
+        """
+        # Create spawn attempt for this cluster
+        spawn = self._create_spawn_attempt(cluster_id, cluster, rng)
+        
+        # Try to place the wild
+        if self._place_wild(grid, spawn, cluster, free_mask, rng):
+            logger.debug(
+                f"Spawned {spawn.wild_type.name} at {spawn.spawned_position} "
+                f"for cluster {cluster_id}"
             )
+        else:
+            logger.debug(
+                f"Failed to spawn wild for cluster {cluster_id} - "
+                f"no available positions"
+            )
+        
+        return spawn
+    
+    def batch_spawn_for_cluster(
+        self, 
+        cluster: Cluster, 
+        n: int, 
+        rng: SpinRNG
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Draw n independent spawns for one cluster on an empty footprint.
+        
+        Intended for distribution checks and statistics, where looping the
+        full spawn pipeline n times is wasted work. Takes n uniforms from
+        rng for the wild types, then n for the positions. Nothing is placed
+        on a grid.
+        
+        Args:
+            cluster: The winning cluster whose footprint to spawn into
+            n: Number of spawns to draw
+            rng: Random number generator
             
-            if success:
-                occupied_positions.add(spawn.spawned_position)
-                logger.debug(
-                    f"Spawned {spawn.wild_type.name} at {spawn.spawned_position} "
-                    f"for cluster {cluster_id}"
-                )
-            else:
-                logger.debug(
-                    f"Failed to spawn wild for cluster {cluster_id} - "
-                    f"no available positions"
-                )
-            
-            spawn_attempts.append(spawn)
+        Returns:
+            Tuple of (wild type codes, flat row-major position indices),
+            each an array of length n
+        """
+        if not cluster.indices:
+            raise ValueError("Cannot spawn into an empty footprint")
         
-        return spawn_attempts
+        wild_types = self.pick_wild_types(rng, n)
+        footprint = np.array(cluster.indices, dtype=np.intp)
+        positions = footprint[(rng.random_batch(n) * len(footprint)).astype(np.intp)]
+        return wild_types, positions
+    
+    def pick_wild_types(self, rng: SpinRNG, n: int) -> np.ndarray:
+        """
+        Draw n wild types with one batch of uniforms.
+        
+        Each draw follows the same rule as a single spawn: WILD when the
+        uniform is below WILD_PROBABILITY, E_WILD otherwise.
+        
+        Args:
+            rng: Random number generator
+            n: Number of wild types to draw
+            
+        Returns:
+            Array of n symbol codes (int8)
+        """
+        return np.where(
+            rng.random_batch(n) < self.WILD_PROBABILITY, Symbol.WILD, Symbol.E_WILD
+        ).astype(np.int8)
     
     def _create_spawn_attempt(
         self, 
@@ -142,7 +218,8 @@ class WildSpawningSystem:
         self, 
         grid: Grid, 
         spawn: WildSpawn, 
-        occupied_positions: Set[Tuple[int, int]], 
+        cluster: Cluster, 
+        free_mask: int, 
         rng: SpinRNG
     ) -> bool:
         """
@@ -151,35 +228,35 @@ class WildSpawningSystem:
         Args:
             grid: Current game grid
             spawn: The spawn attempt to process
-            occupied_positions: Positions already claimed by other spawns
+            cluster: The cluster the spawn belongs to
+            free_mask: Bitboard of positions still empty and unclaimed
             rng: Random number generator
             
         Returns:
             True if wild was successfully placed, False otherwise
         """
-        # Find empty positions within the cluster footprint
-        available_positions = []
-        
-        for pos in spawn.footprint:
-            row, col = pos
-            # Position must be empty and not claimed by another spawn
-            if grid.is_empty(row, col) and pos not in occupied_positions:
-                available_positions.append(pos)
-        
         # If no positions available, spawn fails
-        if not available_positions:
+        open_mask = cluster.position_mask & free_mask
+        if not open_mask:
             spawn.success = False
             return False
         
+        # Empty positions within the footprint, in footprint order; a fully
+        # open footprint needs no filtering
+        if open_mask == cluster.position_mask:
+            available_indices = cluster.indices
+        else:
+            available_indices = [idx for idx in cluster.indices if open_mask >> idx & 1]
+        
         # Select random position from available ones
-        selected_position = rng.choice(available_positions)
-        row, col = selected_position
+        selected_index = rng.choice(available_indices)
+        row, col = divmod(selected_index, COLS)
         
         # Place the wild on the grid
         grid.set_symbol(row, col, spawn.wild_type)
         
         # Update spawn record
-        spawn.spawned_position = selected_position
+        spawn.spawned_position = (row, col)
         spawn.success = True
         
         return True
@@ -230,4 +307,4 @@ class WildSpawningSystem:
         if self.WILD_PROBABILITY < 0 or self.EXPLOSIVO_WILD_PROBABILITY < 0:
             return False
         
-        return True
\ No newline at end of file
+        return True
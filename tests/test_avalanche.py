@@ -243,9 +243,7 @@ class TestAvalancheCascades:
         self.system.reset()
         
         # Fill grid manually to control the test
-        for row in range(5):
-            for col in range(5):
-                self.system.grid.set_symbol(row, col, Symbol.PINK_SK)
+        self.system.grid.fill(Symbol.PINK_SK)
                 
         # Force one EW
         self.system.grid.set_symbol(2, 2, Symbol.E_WILD)
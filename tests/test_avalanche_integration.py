@@ -1,11 +1,30 @@
 """Integration tests for the complete avalanche system."""
 
+from dataclasses import dataclass
+
 import pytest
 from simulator.core.avalanche import AvalancheSystem, GameState, MultiplierLevel
 from simulator.core.symbol import Symbol
 from simulator.core.rng import SpinRNG
 
 
+@dataclass(frozen=True, slots=True)
+class SpinSummary:
+    """Hashable summary of a spin result for determinism checks."""
+    total_win: int
+    cascades: int
+    max_mult: int
+    scatters: int
+    fs_triggered: bool
+
+    @classmethod
+    def from_result(cls, result):
+        """Build a summary from a CascadeResult."""
+        return cls(result.total_win, result.total_cascades,
+                   result.max_multiplier_reached, result.scatters_found,
+                   result.free_spins_triggered)
+
+
 class TestCompleteGameFlow:
     """Test complete game flows from start to finish."""
     
@@ -194,63 +213,49 @@ class TestCompleteGameFlow:
             assert self.system.state.cascade_count == 3 + i
 
 
+@pytest.fixture(scope="class")
+def fresh_system():
+    """Shared system; each test resets it before use."""
+    return AvalancheSystem()
+
+
+@pytest.fixture
+def rng():
+    """Fixed-seed RNG for reproducible cascades."""
+    return SpinRNG(seed=12345)
+
+
 class TestMaxWinScenarios:
     """Test max win cap scenarios."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.system = AvalancheSystem()
-        self.rng = SpinRNG(seed=12345)
-        
-    def test_max_win_immediate_termination(self):
-        """Test that reaching max win immediately ends the spin."""
-        self.system.reset(bet_amount=1000)  # $10 bet
+    @pytest.mark.parametrize("bet,init_win,scatters,cluster_row,start_state,expected_cap", [
+        (1000, 7499000, [], 0, GameState.CHECK_CLUSTERS, 7500000),
+        (100, 749000, [(0, 0), (0, 1), (0, 2)], 1, GameState.CHECK_SCATTERS, 750000),
+    ], ids=["immediate_termination", "cancels_features"])
+    def test_max_win(self, fresh_system, rng, bet, init_win, scatters,
+                     cluster_row, start_state, expected_cap):
+        """Test that reaching max win ends the spin and cancels features."""
+        fresh_system.reset(bet_amount=bet)
         
         # Set initial win very close to max
-        self.system.state.total_win = 7499000  # 7499x
-        
-        # Set up a small cluster to push over max
-        for col in range(5):
-            self.system.grid.set_symbol(0, col, Symbol.PINK_SK)
-                
-        # Process with low multiplier to control the win
-        self.system.state.current_state = GameState.CHECK_CLUSTERS
-        self.system.state.is_initial_drop = False
-        
-        result = self.system.play_spin(self.rng)
-        
-        # Should hit max win
-        assert result.max_win_reached
-        assert result.total_win == 7500000  # Exactly 7500x
-        
-    def test_max_win_cancels_features(self):
-        """Test that max win cancels pending features."""
-        self.system.reset(bet_amount=100)
+        fresh_system.state.total_win = init_win
         
-        # Set near max win
-        self.system.state.total_win = 749000  # 7490x
+        # Pending scatters must not survive the max win
+        for row, col in scatters:
+            fresh_system.grid.set_symbol(row, col, Symbol.SCATTER)
         
-        # Add scatters for free spins
-        self.system.grid.set_symbol(0, 0, Symbol.SCATTER)
-        self.system.grid.set_symbol(0, 1, Symbol.SCATTER)
-        self.system.grid.set_symbol(0, 2, Symbol.SCATTER)
-        
-        # Add small win to push over
+        # Add a small cluster to push over max
         for col in range(5):
-            self.system.grid.set_symbol(1, col, Symbol.PINK_SK)
-            
-        # Process
-        self.system.state.current_state = GameState.CHECK_SCATTERS
-        self.system.state.is_initial_drop = False
+            fresh_system.grid.set_symbol(cluster_row, col, Symbol.PINK_SK)
         
-        result = self.system.play_spin(self.rng)
+        fresh_system.state.current_state = start_state
+        fresh_system.state.is_initial_drop = False
+        
+        result = fresh_system.play_spin(rng)
         
-        # Should hit max win
+        # Should hit max win, capped at exactly 7500x
         assert result.max_win_reached
-        # Total win should be capped at exactly 7500x
-        assert result.total_win <= 750000  # Max 7500x
-        # It hit max win, so should be at the cap
-        assert result.total_win == 750000  # Exactly 7500x
+        assert result.total_win == expected_cap
 
 
 class TestDeterministicBehavior:
@@ -266,17 +271,10 @@ class TestDeterministicBehavior:
             system.reset()
             
             result = system.play_spin(rng)
-            results.append({
-                'total_win': result.total_win,
-                'cascades': result.total_cascades,
-                'max_mult': result.max_multiplier_reached,
-                'scatters': result.scatters_found,
-                'fs_triggered': result.free_spins_triggered
-            })
+            results.append(SpinSummary.from_result(result))
             
         # All results should be identical
-        for i in range(1, len(results)):
-            assert results[i] == results[0]
+        assert len(set(results)) == 1
             
     def test_different_seeds_different_results(self):
         """Test that different seeds produce different results."""
@@ -288,7 +286,7 @@ class TestDeterministicBehavior:
             system.reset()
             
             result = system.play_spin(rng)
-            results.append(result.total_cascades)
+            results.append(SpinSummary.from_result(result))
             
         # Results should vary (extremely unlikely to be all the same)
         assert len(set(results)) > 1
@@ -1,51 +1,100 @@
 """Unit tests for cluster detection system."""
 
+import time
+import numpy as np
 import pytest
 from simulator.core.grid import Grid
 from simulator.core.symbol import Symbol
-from simulator.core.clusters import ClusterDetector, Cluster
+from simulator.core.clusters import ClusterDetector, Cluster, ClusterResult, _ADJ
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """Detector shared by the whole module, warmed up once."""
+    shared = ClusterDetector()
+    warmup = Grid()
+    warmup.set_symbol(0, 0, Symbol.PINK_SK)
+    shared.find_clusters(warmup)
+    return shared
+
+
+@pytest.fixture(scope="module")
+def _module_grid():
+    """Grid allocated once for the module."""
+    return Grid()
+
+
+@pytest.fixture
+def grid(_module_grid):
+    """The module grid, reset to empty for each test."""
+    _module_grid.reset()
+    return _module_grid
+
+
+def _autorange(func, min_total=0.05, min_rounds=30, max_rounds=1000):
+    """
+    Time func with an adaptive number of calls, like timeit's autorange.
+    
+    The call count starts at min_rounds and doubles until the total
+    elapsed time reaches min_total seconds or max_rounds is hit.
+    
+    Returns:
+        Tuple of (elapsed nanoseconds, number of calls)
+    """
+    min_total_ns = min_total * 1e9
+    n = min_rounds
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(n):
+            func()
+        elapsed_ns = time.perf_counter_ns() - start
+        if elapsed_ns >= min_total_ns or n >= max_rounds:
+            return elapsed_ns, n
+        n = min(n * 2, max_rounds)
+
+
+def _best_of_ns(func, trials=10):
+    """Return the fastest single-call time of func in nanoseconds."""
+    best = None
+    for _ in range(trials):
+        start = time.perf_counter_ns()
+        func()
+        elapsed_ns = time.perf_counter_ns() - start
+        if best is None or elapsed_ns < best:
+            best = elapsed_ns
+    return best
 
 
 class TestClusterDetection:
     """Test basic cluster detection functionality."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.detector = ClusterDetector()
-    
-    def test_simple_horizontal_cluster(self):
+    def test_simple_horizontal_cluster(self, detector, grid):
         """Test detection of simple horizontal cluster."""
-        grid = Grid()
-        
         # Create horizontal cluster of 5 pink symbols
         for col in range(5):
             grid.set_symbol(2, col, Symbol.PINK_SK)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 1
         assert clusters[0].symbol == Symbol.PINK_SK
         assert clusters[0].size == 5
         assert len(clusters[0].positions) == 5
     
-    def test_simple_vertical_cluster(self):
+    def test_simple_vertical_cluster(self, detector, grid):
         """Test detection of simple vertical cluster."""
-        grid = Grid()
-        
         # Create vertical cluster of 5 green symbols
         for row in range(5):
             grid.set_symbol(row, 2, Symbol.GREEN_SK)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 1
         assert clusters[0].symbol == Symbol.GREEN_SK
         assert clusters[0].size == 5
     
-    def test_l_shaped_cluster(self):
+    def test_l_shaped_cluster(self, detector, grid):
         """Test detection of L-shaped cluster."""
-        grid = Grid()
-        
         # Create L-shaped cluster
         # B B B
         # B
@@ -55,28 +104,24 @@ class TestClusterDetection:
         for row in range(3):
             grid.set_symbol(row, 0, Symbol.BLUE_SK)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 1
         assert clusters[0].symbol == Symbol.BLUE_SK
         assert clusters[0].size == 5
     
-    def test_cluster_too_small(self):
+    def test_cluster_too_small(self, detector, grid):
         """Test that clusters smaller than 5 are not detected."""
-        grid = Grid()
-        
         # Create cluster of only 4 symbols
         for col in range(4):
             grid.set_symbol(1, col, Symbol.ORANGE_SK)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 0
     
-    def test_multiple_clusters(self):
+    def test_multiple_clusters(self, detector, grid):
         """Test detection of multiple separate clusters."""
-        grid = Grid()
-        
         # Create truly separate clusters with gap between them
         # First cluster: 5 horizontal pink at top
         for col in range(5):
@@ -94,25 +139,24 @@ class TestClusterDetection:
         for col in range(5):
             grid.set_symbol(4, col, Symbol.BLUE_SK)
             
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         # All three should be separate
         assert len(clusters) == 3
         
         # Check each cluster type exists
-        symbols = {c.symbol for c in clusters}
-        assert Symbol.PINK_SK in symbols
-        assert Symbol.GREEN_SK in symbols  
-        assert Symbol.BLUE_SK in symbols
+        assert Symbol.PINK_SK in clusters.symbols
+        assert Symbol.GREEN_SK in clusters.symbols
+        assert Symbol.BLUE_SK in clusters.symbols
+        assert clusters.symbol_mask == (
+            1 << Symbol.PINK_SK | 1 << Symbol.GREEN_SK | 1 << Symbol.BLUE_SK)
         
         # All should be size 5
         for cluster in clusters:
             assert cluster.size == 5
     
-    def test_wild_in_cluster(self):
+    def test_wild_in_cluster(self, detector, grid):
         """Test wild participation in cluster."""
-        grid = Grid()
-        
         # Create cluster with wild: P W P P P
         grid.set_symbol(1, 0, Symbol.PINK_SK)
         grid.set_symbol(1, 1, Symbol.WILD)
@@ -120,46 +164,40 @@ class TestClusterDetection:
         grid.set_symbol(1, 3, Symbol.PINK_SK)
         grid.set_symbol(1, 4, Symbol.PINK_SK)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 1
         assert clusters[0].symbol == Symbol.PINK_SK
         assert clusters[0].size == 5
         assert (1, 1) in clusters[0].positions  # Wild position included
     
-    def test_explosivo_wild_in_cluster(self):
+    def test_explosivo_wild_in_cluster(self, detector, grid):
         """Test explosivo wild participation in cluster."""
-        grid = Grid()
-        
         # Create cluster with explosivo wild
         for row in range(4):
             grid.set_symbol(row, 2, Symbol.CYAN_SK)
         grid.set_symbol(4, 2, Symbol.E_WILD)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 1
         assert clusters[0].symbol == Symbol.CYAN_SK
         assert clusters[0].size == 5
         assert (4, 2) in clusters[0].positions
     
-    def test_scatter_not_in_cluster(self):
+    def test_scatter_not_in_cluster(self, detector, grid):
         """Test that scatters don't participate in clusters."""
-        grid = Grid()
-        
         # Try to create cluster with scatter
         for col in range(4):
             grid.set_symbol(2, col, Symbol.LADY_SK)
         grid.set_symbol(2, 4, Symbol.SCATTER)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 0  # Only 4 symbols, scatter doesn't count
     
-    def test_empty_positions_break_cluster(self):
+    def test_empty_positions_break_cluster(self, detector, grid):
         """Test that empty positions break clusters."""
-        grid = Grid()
-        
         # Create broken cluster: P P _ P P
         grid.set_symbol(1, 0, Symbol.PINK_SK)
         grid.set_symbol(1, 1, Symbol.PINK_SK)
@@ -167,49 +205,110 @@ class TestClusterDetection:
         grid.set_symbol(1, 3, Symbol.PINK_SK)
         grid.set_symbol(1, 4, Symbol.PINK_SK)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 0  # Gap breaks the cluster
     
-    def test_diagonal_not_connected(self):
+    def test_diagonal_not_connected(self, detector, grid):
         """Test that diagonal connections don't count."""
-        grid = Grid()
-        
         # Create diagonal pattern
         for i in range(5):
             grid.set_symbol(i, i, Symbol.BLUE_SK)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 0  # Diagonals don't connect
     
-    def test_cluster_size_capped_at_15(self):
+    def test_cluster_size_capped_at_15(self, detector, grid):
         """Test that cluster size is capped at 15."""
-        grid = Grid()
-        
         # Fill entire grid with same symbol (25 positions)
-        for row in range(5):
-            for col in range(5):
-                grid.set_symbol(row, col, Symbol.ORANGE_SK)
+        grid.load_array(np.full((5, 5), Symbol.ORANGE_SK, dtype=np.int8))
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 1
         assert clusters[0].size == 15  # Capped at 15
         assert len(clusters[0].positions) == 25  # But all positions included
+    
+    def test_cluster_position_mask(self, detector, grid):
+        """Test that the position bitmask mirrors the position list."""
+        for col in range(5):
+            grid.set_symbol(1, col, Symbol.GREEN_SK)
+        grid.set_symbol(2, 4, Symbol.WILD)
+        
+        cluster = detector.find_clusters(grid)[0]
+        
+        assert cluster.position_mask.bit_count() == len(cluster.positions)
+        assert cluster.position_mask == Cluster(
+            cluster.symbol, list(cluster.positions), cluster.size).position_mask
+        assert (2, 4) in cluster
+        assert (2, 3) not in cluster
+        assert cluster.indices == Cluster(
+            cluster.symbol, list(cluster.positions), cluster.size).indices
+        assert [divmod(idx, 5) for idx in cluster.indices] == cluster.positions
+        assert cluster.position_set == frozenset(cluster.positions)
+        assert cluster.position_set is cluster.position_set
+    
+    def test_cluster_off_grid_positions(self):
+        """Test off-grid positions are never members and cannot be built in."""
+        cluster = Cluster(Symbol.PINK_SK, [(1, 0), (1, 1), (2, 0), (2, 1), (3, 0)], 5)
+        
+        # (0, 5) would alias bit 5, which is (1, 0)
+        assert (0, 5) not in cluster
+        assert (-1, 0) not in cluster
+        assert (5, 0) not in cluster
+        
+        with pytest.raises(ValueError):
+            Cluster(Symbol.PINK_SK, [(0, 4), (0, 5)], 2)
+        with pytest.raises(ValueError):
+            Cluster(Symbol.PINK_SK, [(-1, 0)], 1)
+    
+    def test_cluster_result_by_symbol(self, detector, grid):
+        """Test grouping of detected clusters by symbol."""
+        for col in range(5):
+            grid.set_symbol(0, col, Symbol.PINK_SK)
+            grid.set_symbol(4, col, Symbol.BLUE_SK)
+        
+        clusters = detector.find_clusters(grid)
+        
+        assert isinstance(clusters, ClusterResult)
+        assert clusters.all is clusters
+        assert set(clusters.by_symbol) == {Symbol.PINK_SK, Symbol.BLUE_SK}
+        assert clusters.by_symbol[Symbol.BLUE_SK][0].positions[0] == (4, 0)
+    
+    def test_cached_detection_matches(self, grid):
+        """Test the opt-in label cache returns the same clusters."""
+        cached = ClusterDetector(cache_enabled=True)
+        for col in range(5):
+            grid.set_symbol(2, col, Symbol.ORANGE_SK)
+        grid.set_symbol(1, 2, Symbol.WILD)
+        
+        first = cached.find_clusters(grid)
+        second = cached.find_clusters(grid)
+        
+        assert first == second == ClusterDetector().find_clusters(grid)
+        assert first[0] is not second[0]
+    
+    def test_cluster_clear_on(self, detector, grid):
+        """Test clearing a cluster empties exactly its cells."""
+        for col in range(5):
+            grid.set_symbol(4, col, Symbol.GREEN_SK)
+        grid.set_symbol(3, 4, Symbol.GREEN_SK)
+        grid.set_symbol(0, 0, Symbol.LADY_SK)
+        
+        cluster = detector.find_clusters(grid)[0]
+        cluster.clear_on(grid)
+        
+        assert grid.count_symbol(Symbol.GREEN_SK) == 0
+        assert grid.get_symbol(0, 0) == Symbol.LADY_SK
+        assert grid.count_symbol(Symbol.EMPTY) == 24
 
 
 class TestWildClusters:
     """Test complex wild participation in clusters."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.detector = ClusterDetector()
-    
-    def test_wild_connects_different_symbols(self):
+    def test_wild_connects_different_symbols(self, detector, grid):
         """Test wild connecting different symbol types."""
-        grid = Grid()
-        
         # Create pattern:
         # P P W B B
         grid.set_symbol(1, 0, Symbol.PINK_SK)
@@ -224,7 +323,7 @@ class TestWildClusters:
         grid.set_symbol(0, 3, Symbol.BLUE_SK)
         grid.set_symbol(2, 3, Symbol.BLUE_SK)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 2
         
@@ -232,10 +331,8 @@ class TestWildClusters:
         for cluster in clusters:
             assert (1, 2) in cluster.positions
     
-    def test_wild_in_multiple_clusters(self):
+    def test_wild_in_multiple_clusters(self, detector, grid):
         """Test single wild participating in multiple clusters."""
-        grid = Grid()
-        
         # Create cross pattern with wild in center
         #   P
         #   P
@@ -264,7 +361,7 @@ class TestWildClusters:
         grid.set_symbol(3, 1, Symbol.GREEN_SK)
         grid.set_symbol(2, 0, Symbol.GREEN_SK)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         # Should find green and blue clusters (pink broken by wild)
         assert len(clusters) == 2
@@ -277,23 +374,19 @@ class TestWildClusters:
         
         assert wild_count == 2  # Wild in both clusters
     
-    def test_pure_wild_cluster_invalid(self):
+    def test_pure_wild_cluster_invalid(self, detector, grid):
         """Test that pure wild clusters are not valid."""
-        grid = Grid()
-        
         # Create cluster of only wilds
         positions = [(1, 1), (1, 2), (1, 3), (2, 1), (2, 2)]
         for row, col in positions:
             grid.set_symbol(row, col, Symbol.WILD)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 0  # Pure wild cluster not valid
     
-    def test_wild_chain(self):
+    def test_wild_chain(self, detector, grid):
         """Test chain of wilds connecting paying symbols."""
-        grid = Grid()
-        
         # Create pattern: P W W W P
         grid.set_symbol(1, 0, Symbol.PINK_SK)
         grid.set_symbol(1, 1, Symbol.WILD)
@@ -301,7 +394,7 @@ class TestWildClusters:
         grid.set_symbol(1, 3, Symbol.WILD)
         grid.set_symbol(1, 4, Symbol.PINK_SK)
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         assert len(clusters) == 1
         assert clusters[0].symbol == Symbol.PINK_SK
@@ -311,56 +404,30 @@ class TestWildClusters:
 class TestPRDExamples:
     """Test specific examples from the PRD."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.detector = ClusterDetector()
+    @classmethod
+    def setup_class(cls):
+        """Build the PRD boards once for the class."""
+        # The exact grid from the PRD 8 pink cluster example
+        layout = [
+            [Symbol.LADY_SK, Symbol.PINK_SK, Symbol.GREEN_SK, Symbol.BLUE_SK, Symbol.ORANGE_SK],
+            [Symbol.CYAN_SK, Symbol.WILD, Symbol.PINK_SK, Symbol.PINK_SK, Symbol.GREEN_SK],
+            [Symbol.BLUE_SK, Symbol.PINK_SK, Symbol.PINK_SK, Symbol.PINK_SK, Symbol.LADY_SK],
+            [Symbol.ORANGE_SK, Symbol.PINK_SK, Symbol.E_WILD, Symbol.PINK_SK, Symbol.BLUE_SK],
+            [Symbol.SCATTER, Symbol.CYAN_SK, Symbol.GREEN_SK, Symbol.SCATTER, Symbol.ORANGE_SK],
+        ]
+        cls._PRD_CODES = np.array(layout, dtype=np.int8)
+        cls._PRD_CODES.setflags(write=False)
     
-    def test_prd_8_pink_cluster_example(self):
+    def test_prd_8_pink_cluster_example(self, detector, grid):
         """Test the 8 pink cluster example from PRD."""
-        grid = Grid()
-        
-        # Set up the exact grid from PRD
-        # Row 0
-        grid.set_symbol(0, 0, Symbol.LADY_SK)
-        grid.set_symbol(0, 1, Symbol.PINK_SK)
-        grid.set_symbol(0, 2, Symbol.GREEN_SK)
-        grid.set_symbol(0, 3, Symbol.BLUE_SK)
-        grid.set_symbol(0, 4, Symbol.ORANGE_SK)
-        
-        # Row 1
-        grid.set_symbol(1, 0, Symbol.CYAN_SK)
-        grid.set_symbol(1, 1, Symbol.WILD)
-        grid.set_symbol(1, 2, Symbol.PINK_SK)
-        grid.set_symbol(1, 3, Symbol.PINK_SK)
-        grid.set_symbol(1, 4, Symbol.GREEN_SK)
+        grid.load_array(self._PRD_CODES)
         
-        # Row 2
-        grid.set_symbol(2, 0, Symbol.BLUE_SK)
-        grid.set_symbol(2, 1, Symbol.PINK_SK)
-        grid.set_symbol(2, 2, Symbol.PINK_SK)
-        grid.set_symbol(2, 3, Symbol.PINK_SK)
-        grid.set_symbol(2, 4, Symbol.LADY_SK)
-        
-        # Row 3
-        grid.set_symbol(3, 0, Symbol.ORANGE_SK)
-        grid.set_symbol(3, 1, Symbol.PINK_SK)
-        grid.set_symbol(3, 2, Symbol.E_WILD)
-        grid.set_symbol(3, 3, Symbol.PINK_SK)
-        grid.set_symbol(3, 4, Symbol.BLUE_SK)
-        
-        # Row 4
-        grid.set_symbol(4, 0, Symbol.SCATTER)
-        grid.set_symbol(4, 1, Symbol.CYAN_SK)
-        grid.set_symbol(4, 2, Symbol.GREEN_SK)
-        grid.set_symbol(4, 3, Symbol.SCATTER)
-        grid.set_symbol(4, 4, Symbol.ORANGE_SK)
-        
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         # Should find the pink cluster
         assert len(clusters) >= 1
         
-        pink_cluster = next((c for c in clusters if c.symbol == Symbol.PINK_SK), None)
+        pink_cluster = clusters.by_symbol.get(Symbol.PINK_SK, [None])[0]
         assert pink_cluster is not None
         
         # The actual cluster from the grid analysis
@@ -379,46 +446,30 @@ class TestPRDExamples:
 class TestEdgeCases:
     """Test edge cases and special scenarios."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.detector = ClusterDetector()
-    
-    def test_empty_grid(self):
+    def test_empty_grid(self, detector, grid):
         """Test cluster detection on empty grid."""
-        grid = Grid()
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         assert len(clusters) == 0
     
-    def test_grid_full_of_scatters(self):
+    def test_grid_full_of_scatters(self, detector, grid):
         """Test grid full of scatters."""
-        grid = Grid()
-        
-        for row in range(5):
-            for col in range(5):
-                grid.set_symbol(row, col, Symbol.SCATTER)
+        grid.load_array(np.full((5, 5), Symbol.SCATTER, dtype=np.int8))
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         assert len(clusters) == 0
     
-    def test_alternating_pattern(self):
+    def test_alternating_pattern(self, detector, grid):
         """Test alternating symbol pattern."""
-        grid = Grid()
-        
         # Create checkerboard pattern
-        for row in range(5):
-            for col in range(5):
-                if (row + col) % 2 == 0:
-                    grid.set_symbol(row, col, Symbol.PINK_SK)
-                else:
-                    grid.set_symbol(row, col, Symbol.BLUE_SK)
+        rows, cols = np.mgrid[0:5, 0:5]
+        grid.load_array(np.where((rows + cols) % 2 == 0,
+                                 Symbol.PINK_SK, Symbol.BLUE_SK))
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         assert len(clusters) == 0  # No clusters possible
     
-    def test_complex_multi_cluster(self):
+    def test_complex_multi_cluster(self, detector, grid):
         """Test complex scenario with multiple overlapping clusters."""
-        grid = Grid()
-        
         # Create complex pattern with multiple clusters
         # Fill grid strategically
         pattern = [
@@ -429,11 +480,9 @@ class TestEdgeCases:
             [Symbol.GREEN_SK, Symbol.GREEN_SK, Symbol.WILD, Symbol.CYAN_SK, Symbol.CYAN_SK]
         ]
         
-        for row in range(5):
-            for col in range(5):
-                grid.set_symbol(row, col, pattern[row][col])
+        grid.load_array(np.array(pattern, np.int8))
         
-        clusters = self.detector.find_clusters(grid)
+        clusters = detector.find_clusters(grid)
         
         # Should find 4 clusters (pink, blue, green, cyan)
         assert len(clusters) == 4
@@ -444,55 +493,59 @@ class TestEdgeCases:
             assert (2, 2) in cluster.positions
 
 
+class TestAdjacencyTable:
+    """Test the precomputed 4-neighbour adjacency table."""
+    
+    def test_neighbor_counts(self):
+        """Corners have 2 neighbours, edges 3 and interior cells 4."""
+        assert _ADJ[0, 0] == 2 and _ADJ[24, 0] == 2
+        assert _ADJ[2, 0] == 3
+        assert _ADJ[12, 0] == 4
+    
+    def test_neighbors_are_orthogonal(self):
+        """Every listed neighbour is one step up, down, left or right."""
+        for idx in range(25):
+            row, col = divmod(idx, 5)
+            neighbors = _ADJ[idx, 1:1 + _ADJ[idx, 0]]
+            assert (_ADJ[idx, 1 + _ADJ[idx, 0]:] == -1).all()
+            for nb in neighbors:
+                n_row, n_col = divmod(int(nb), 5)
+                assert abs(n_row - row) + abs(n_col - col) == 1
+
+
 class TestClusterPerformance:
     """Test cluster detection performance."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.detector = ClusterDetector()
-    
-    def test_worst_case_performance(self):
+    def test_worst_case_performance(self, detector, grid):
         """Test performance in worst case scenario."""
-        grid = Grid()
-        
         # Worst case: many small non-connecting groups
         # This forces algorithm to check many possibilities
-        for row in range(5):
-            for col in range(5):
-                # Create a complex pattern
-                symbol_idx = (row * 5 + col) % 6
-                symbols = [Symbol.PINK_SK, Symbol.GREEN_SK, Symbol.BLUE_SK,
-                          Symbol.ORANGE_SK, Symbol.CYAN_SK, Symbol.LADY_SK]
-                grid.set_symbol(row, col, symbols[symbol_idx])
-        
-        # Should still complete quickly
-        import time
-        start = time.time()
-        clusters = self.detector.find_clusters(grid)
-        elapsed = time.time() - start
+        symbols = np.array([Symbol.PINK_SK, Symbol.GREEN_SK,
+                            Symbol.BLUE_SK, Symbol.ORANGE_SK,
+                            Symbol.CYAN_SK, Symbol.LADY_SK], np.int8)
+        grid.load_array(symbols[np.arange(25) % 6])
+        
+        # Warm up, then take the best of several runs to suppress GC noise
+        for _ in range(10):
+            detector.find_clusters(grid)
+        best_ns = _best_of_ns(lambda: detector.find_clusters(grid))
         
         # Should complete in under 1ms
-        assert elapsed < 0.001
+        assert best_ns < 1_000_000
         
-    def test_reuse_performance(self):
+    def test_reuse_performance(self, detector, grid):
         """Test that detector can be reused efficiently."""
-        grid = Grid()
-        
-        # Fill with some pattern
-        for row in range(5):
-            for col in range(5):
-                if row == 2:
-                    grid.set_symbol(row, col, Symbol.PINK_SK)
+        # Fill the middle row
+        rows, _ = np.mgrid[0:5, 0:5]
+        grid.load_array(np.where(rows == 2, Symbol.PINK_SK, Symbol.EMPTY))
         
-        # Run detection multiple times
-        import time
-        start = time.time()
-        for _ in range(1000):
-            clusters = self.detector.find_clusters(grid)
-        elapsed = time.time() - start
+        # Warm up, then run detection until the timing is stable
+        for _ in range(10):
+            detector.find_clusters(grid)
+        elapsed_ns, n = _autorange(lambda: detector.find_clusters(grid))
         
         # Should average less than 0.1ms per detection
-        assert elapsed / 1000 < 0.0001
+        assert elapsed_ns / n < 100_000
 
 
 if __name__ == "__main__":
@@ -65,6 +65,20 @@ class TestWeightConfiguration:
         for symbol, expected_weight in expected.items():
             actual_weight = config.BG_WEIGHTS[bg_idx[symbol]]
             assert abs(actual_weight - expected_weight) < 0.005
+    
+    def test_rebuild_weight_arrays(self):
+        """Test that arrays are regenerated from the dictionaries."""
+        original_bg = config.SYMBOL_GENERATION_WEIGHTS_BG.copy()
+        try:
+            config.SYMBOL_GENERATION_WEIGHTS_BG["LADY_SK"] = 0
+            config._rebuild_weight_arrays()
+            
+            bg_idx = {s: i for i, s in enumerate(config.BG_SYMBOL_NAMES)}
+            assert config.BG_WEIGHTS[bg_idx["LADY_SK"]] == 0.0
+            assert np.isclose(config.BG_WEIGHTS.sum(), 1.0)
+        finally:
+            config.SYMBOL_GENERATION_WEIGHTS_BG.update(original_bg)
+            config._rebuild_weight_arrays()
 
 
 class TestPaytableConfiguration:
@@ -85,6 +99,16 @@ class TestPaytableConfiguration:
         assert config.get_payout("LADY_SK", 20) == 150.0
         assert config.get_payout("LADY_SK", 100) == 150.0
     
+    def test_payout_array_matches_paytable(self):
+        """Test that the dense payout array mirrors PAYTABLE."""
+        for (symbol, size), payout in config.PAYTABLE.items():
+            symbol_id = config.PAYING_SYMBOL_IDS[symbol]
+            assert config.PAYTABLE_ARR[symbol_id, size] == payout
+        
+        # Sizes below the minimum cluster never pay
+        assert not config.PAYTABLE_ARR[:, :5].any()
+        assert config.get_payout("WILD", 5) == 0.0
+    
     def test_all_symbols_have_payouts(self):
         """Test that all paying symbols have complete paytables."""
         for symbol in config.PAYING_SYMBOLS:
@@ -123,6 +147,30 @@ class TestConfigurationValidation:
         # Restore
         config.SYMBOL_GENERATION_WEIGHTS_BG.update(original_bg)
         config.validate_config()  # Should pass again
+    
+    def test_validate_config_names_negative_weight(self):
+        """Test that validation reports which symbol has a negative weight."""
+        original_fs = config.SYMBOL_GENERATION_WEIGHTS_FS.copy()
+        try:
+            config.SYMBOL_GENERATION_WEIGHTS_FS["SCATTER"] = -3
+            with pytest.raises(ValueError, match="SCATTER in free spins"):
+                config.validate_config()
+        finally:
+            config.SYMBOL_GENERATION_WEIGHTS_FS.update(original_fs)
+        config.validate_config()
+    
+    def test_validate_config_names_unknown_paytable_symbol(self):
+        """Test that an unknown paytable symbol reaches validate_config."""
+        config.PAYTABLE[("GOLD_SK", 5)] = 1.0
+        try:
+            # The dense table builder skips it instead of failing first
+            table = config._build_paytable_array()
+            np.testing.assert_array_equal(table, config.PAYTABLE_ARR)
+            with pytest.raises(ValueError, match="Invalid symbol in paytable: GOLD_SK"):
+                config.validate_config()
+        finally:
+            del config.PAYTABLE[("GOLD_SK", 5)]
+        config.validate_config()
 
 
 class TestWeightPersistence:
@@ -3,7 +3,9 @@
 import pytest
 from simulator.core.grid import Grid
 from simulator.core.symbol import Symbol
-from simulator.core.explosions import ExplosionSystem, EWTracker, ExplosionEvent
+from simulator.core.explosions import (
+    ExplosionSystem, EWTracker, ExplosionEvent, _NEIGHBORS, _AREA_BITS
+)
 from simulator.core.clusters import Cluster
 
 
@@ -53,6 +55,61 @@ class TestEWTracker:
         
         # Spawned status overrides landed status
         assert tracker.is_eligible_to_explode((1, 1)) == False
+    
+    def test_position_views_share_masks(self):
+        """Test set-style views read and write the tracker's bitmasks."""
+        tracker = EWTracker()
+        tracker.landed_this_drop.add((3, 4))
+        tracker.landed_this_drop.add((0, 2))
+        
+        assert tracker.landed_mask == (1 << 2) | (1 << 19)
+        assert list(tracker.landed_this_drop) == [(0, 2), (3, 4)]
+        
+        tracker.spawned_mask |= 1 << 19
+        assert (3, 4) in tracker.spawned_this_cascade
+        assert tracker.eligible_mask == 1 << 2
+    
+    def test_position_views_reject_off_grid(self):
+        """Test off-grid positions are rejected, never aliased onto other cells."""
+        tracker = EWTracker()
+        
+        # (0, 5) would alias bit 5, which is (1, 0)
+        with pytest.raises(ValueError):
+            tracker.landed_this_drop.add((0, 5))
+        with pytest.raises(ValueError):
+            tracker.landed_this_drop.add((-1, 0))
+        with pytest.raises(ValueError):
+            tracker.landed_this_drop.discard((-1, 0))
+        assert tracker.landed_mask == 0
+        
+        tracker.landed_this_drop.add((1, 0))
+        assert (0, 5) not in tracker.landed_this_drop
+        assert (-1, 0) not in tracker.landed_this_drop
+        assert not tracker.is_eligible_to_explode((0, 5))
+    
+    def test_position_views_compare_as_sets(self):
+        """Test views compare equal to sets holding the same positions."""
+        tracker = EWTracker()
+        assert tracker.landed_this_drop == set()
+        
+        tracker.landed_this_drop.add((3, 4))
+        tracker.in_winning_clusters.add((3, 4))
+        assert tracker.landed_this_drop == {(3, 4)}
+        assert tracker.landed_this_drop != {(3, 4), (0, 0)}
+        assert tracker.landed_this_drop == tracker.in_winning_clusters
+        assert tracker.landed_this_drop != [(3, 4)]
+    
+    def test_index_api(self):
+        """Test flat-index tracker methods agree with the (row, col) wrappers."""
+        tracker = EWTracker()
+        tracker.add_landed_idx(6)
+        tracker.add_cluster_idx(12)
+        tracker.add_spawned_idx(12)
+        
+        assert tracker.is_eligible(6)
+        assert tracker.is_eligible_to_explode((1, 1))
+        assert not tracker.is_eligible(12)
+        assert not tracker.is_eligible_to_explode((2, 2))
 
 
 class TestExplosionArea:
@@ -100,6 +157,36 @@ class TestExplosionArea:
         
         assert sorted(area) == sorted(expected)
         assert len(area) == 6
+    
+    def test_area_bits_match_area(self):
+        """Test the area bitboards cover exactly the explosion area."""
+        for row in range(5):
+            for col in range(5):
+                bits = _AREA_BITS[row * 5 + col]
+                marked = [divmod(idx, 5) for idx in range(25) if bits >> idx & 1]
+                assert marked == sorted(self.system.calculate_explosion_area((row, col)))
+    
+    def test_explosion_area_canonical_order(self):
+        """Test areas come back as one cached tuple in row-major order."""
+        area = self.system.calculate_explosion_area((0, 3))
+        
+        assert area == ((0, 2), (0, 3), (0, 4), (1, 2), (1, 3), (1, 4))
+        assert area is self.system.calculate_explosion_area((0, 3))
+    
+    def test_off_grid_explosion_area(self):
+        """Test an off-grid centre yields the part of its area on the grid."""
+        assert self.system.calculate_explosion_area((-1, 0)) == ((0, 0), (0, 1))
+        assert self.system.calculate_explosion_area((5, 5)) == ((4, 4),)
+        assert self.system.calculate_explosion_area((9, 9)) == ()
+
+    
+    def test_neighbor_table(self):
+        """Test the padded 3x3 neighbourhood table."""
+        assert _NEIGHBORS.shape == (25, 9)
+        assert not _NEIGHBORS.flags.writeable
+        assert (_NEIGHBORS >= 0).sum(axis=1).tolist()[:5] == [4, 6, 6, 6, 4]
+        assert _NEIGHBORS[12].tolist() == [6, 7, 8, 11, 12, 13, 16, 17, 18]
+        assert _NEIGHBORS[0].tolist() == [0, 1, 5, 6, -1, -1, -1, -1, -1]
 
 
 class TestExplosionMechanics:
@@ -124,6 +211,15 @@ class TestExplosionMechanics:
         assert (3, 3) in self.system.ew_tracker.landed_this_drop
         assert (2, 2) not in self.system.ew_tracker.landed_this_drop
     
+    def test_track_landed_ews_corners(self):
+        """Test landed EW mask covers the first and last grid cells."""
+        self.grid.set_symbol(0, 0, Symbol.E_WILD)
+        self.grid.set_symbol(4, 4, Symbol.E_WILD)
+        
+        self.system.track_landed_ews(self.grid)
+        
+        assert self.system.ew_tracker.landed_mask == 1 | 1 << 24
+    
     def test_track_cluster_ews(self):
         """Test tracking of EWs in winning clusters."""
         # Set up grid with cluster containing EW
@@ -291,6 +387,25 @@ class TestExplosionMechanics:
         assert self.grid.get_symbol(1, 0) == Symbol.EMPTY
         assert self.grid.get_symbol(1, 2) == Symbol.EMPTY
     
+    def test_overlapping_explosions_share_destroyed_cell(self):
+        """Test a cell in two explosion areas is reported by both events."""
+        self.grid.set_symbol(1, 0, Symbol.E_WILD)
+        self.grid.set_symbol(1, 1, Symbol.CYAN_SK)
+        self.grid.set_symbol(1, 2, Symbol.E_WILD)
+        self.grid.set_symbol(1, 3, Symbol.BLUE_SK)
+        self.system.ew_tracker.landed_this_drop.add((1, 0))
+        self.system.ew_tracker.landed_this_drop.add((1, 2))
+        
+        events = self.system.execute_explosions(self.grid)
+        
+        assert events[0].destroyed_positions == [(1, 1)]
+        assert events[1].destroyed_positions == [(1, 1), (1, 3)]
+        assert events[1].ew_index == 7
+        assert events[1].destroyed_count == 2
+        assert events[1].ew_position == (1, 2)
+        assert len(events[1].affected_area) == 9
+        assert self.grid.count_symbol(Symbol.EMPTY) == 25
+    
     def test_ew_collection_tracking(self):
         """Test EW collection for free spins."""
         # Set up grid with cluster EW and landed EW
@@ -363,6 +478,20 @@ class TestExplosionIntegration:
         assert len(self.system.ew_tracker.landed_this_drop) == 0
         assert len(self.system.ew_tracker.in_winning_clusters) == 0
     
+    def test_reset_in_place(self):
+        """Test reset clears tracking on the same tracker object."""
+        tracker = self.system.ew_tracker
+        tracker.landed_this_drop.add((1, 1))
+        tracker.collected_count = 3
+        
+        self.system.reset(preserve_collected=True)
+        assert tracker.landed_mask == 0
+        assert self.system.get_collected_count() == 3
+        
+        self.system.reset()
+        assert self.system.ew_tracker is tracker
+        assert self.system.get_collected_count() == 0
+    
     def test_prd_example(self):
         """Test the example from PRD documentation."""
         # Set up exact grid from PRD
@@ -430,6 +559,15 @@ class TestExplosionIntegration:
         
         # EW itself destroyed
         assert self.grid.get_symbol(3, 2) == Symbol.EMPTY
+        
+        # The same event built from positions, as the original fields were
+        rebuilt = ExplosionEvent.from_positions(
+            ew_position=event.ew_position,
+            affected_area=event.affected_area,
+            destroyed_positions=event.destroyed_positions,
+            from_cluster=event.from_cluster,
+        )
+        assert rebuilt == event
 
 
 if __name__ == "__main__":
@@ -86,8 +86,7 @@ class TestExplosionGameFlow:
         assert (1, 2) in self.explosion_system.ew_tracker.in_winning_clusters
         
         # Remove cluster symbols
-        for pos in clusters[0].positions:
-            self.grid.set_symbol(pos[0], pos[1], Symbol.EMPTY)
+        clusters[0].clear_on(self.grid)
         
         # Apply gravity (symbols fall)
         self.grid.apply_gravity()
@@ -121,8 +120,7 @@ class TestExplosionGameFlow:
         footprint = clusters[0].positions.copy()
         
         # Remove cluster
-        for pos in clusters[0].positions:
-            self.grid.set_symbol(pos[0], pos[1], Symbol.EMPTY)
+        clusters[0].clear_on(self.grid)
         
         # Spawn wild - we'll check if it's an EW
         spawn_result = self.wild_spawner.spawn_wilds_for_clusters(
@@ -182,8 +180,7 @@ class TestExplosionGameFlow:
         assert len(clusters) == 1
         
         # Remove cluster and spawn wild
-        for pos in clusters[0].positions:
-            self.grid.set_symbol(pos[0], pos[1], Symbol.EMPTY)
+        clusters[0].clear_on(self.grid)
         
         spawn_result = self.wild_spawner.spawn_wilds_for_clusters(
             self.grid, clusters, self.rng
@@ -223,8 +220,7 @@ class TestExplosionGameFlow:
         self.explosion_system.track_cluster_ews(clusters, self.grid)
         
         # Remove cluster
-        for pos in clusters[0].positions:
-            self.grid.set_symbol(pos[0], pos[1], Symbol.EMPTY)
+        clusters[0].clear_on(self.grid)
         
         # Count should increase by 1 (collected from cluster)
         assert self.explosion_system.get_collected_count() == 1
@@ -257,9 +253,7 @@ class TestExplosionEdgeCases:
     def test_all_positions_destroyed(self):
         """Test when explosion destroys all symbols."""
         # Fill grid with low-pay and one EW
-        for row in range(5):
-            for col in range(5):
-                self.grid.set_symbol(row, col, Symbol.PINK_SK)
+        self.grid.fill(Symbol.PINK_SK)
         
         # Place EW in center
         self.grid.set_symbol(2, 2, Symbol.E_WILD)
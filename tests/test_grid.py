@@ -1,7 +1,11 @@
 """Unit tests for grid system."""
 
+import numpy as np
 import pytest
-from simulator.core.grid import Grid, ROWS, COLS, TOTAL_POSITIONS, create_test_grid
+from simulator.core.grid import (
+    Grid, ROWS, COLS, TOTAL_POSITIONS, create_test_grid,
+    flags_to_mask, mask_to_flags, mask_to_positions
+)
 from simulator.core.symbol import Symbol
 from simulator.core.rng import SpinRNG
 
@@ -14,14 +18,15 @@ class TestGridBasics:
         grid = Grid()
         
         # Check all positions are empty
-        for row in range(ROWS):
-            for col in range(COLS):
-                assert grid.is_empty(row, col)
+        np.testing.assert_array_equal(grid._symbols, Symbol.EMPTY)
         
         # Check dimensions
         assert len(grid._symbols) == TOTAL_POSITIONS
         assert ROWS == 5
         assert COLS == 5
+        
+        # Slotted instances carry no per-instance attribute dict
+        assert not hasattr(grid, '__dict__')
     
     def test_position_validation(self):
         """Test position boundary validation."""
@@ -76,16 +81,97 @@ class TestGridBasics:
     def test_grid_clear(self):
         """Test clearing the grid."""
         grid = Grid()
+        storage = grid._symbols
         grid.set_symbol(0, 0, Symbol.LADY_SK)
         grid.set_symbol(2, 2, Symbol.WILD)
         
         # Clear grid
         grid.clear()
         
-        # All positions should be empty
-        for row in range(ROWS):
-            for col in range(COLS):
-                assert grid.is_empty(row, col)
+        # All positions should be empty, in the same storage
+        np.testing.assert_array_equal(grid._symbols, Symbol.EMPTY)
+        assert grid._symbols is storage
+        assert grid.count_symbol(Symbol.WILD) == 0
+    
+    def test_grid_reset(self):
+        """Test resetting the grid in place."""
+        grid = Grid()
+        storage = grid._symbols
+        grid.set_symbol(1, 3, Symbol.PINK_SK)
+        assert grid.count_symbol(Symbol.PINK_SK) == 1
+        
+        grid.reset()
+        
+        assert grid._symbols is storage
+        assert grid.count_symbol(Symbol.EMPTY) == TOTAL_POSITIONS
+    
+    def test_cells_view(self):
+        """Test cells() exposes the backing codes without copying."""
+        grid = Grid()
+        grid.set_symbol(2, 3, Symbol.SCATTER)
+        cells = grid.cells()
+        
+        assert cells.shape == (5, 5)
+        assert cells[2, 3] == Symbol.SCATTER
+        
+        cells[0, 0] = Symbol.WILD
+        assert grid.get_symbol(0, 0) == Symbol.WILD
+    
+    def test_fill_and_fill_rect(self):
+        """Test filling the whole grid and a rectangular block."""
+        grid = Grid()
+        grid.fill(Symbol.PINK_SK)
+        assert grid.count_symbol(Symbol.PINK_SK) == TOTAL_POSITIONS
+        
+        grid.fill_rect(1, 3, 2, 5, Symbol.WILD)
+        assert grid.count_symbol(Symbol.WILD) == 6
+        assert grid.get_symbol(1, 2) == Symbol.WILD
+        assert grid.get_symbol(2, 4) == Symbol.WILD
+        assert grid.get_symbol(1, 1) == Symbol.PINK_SK
+        assert grid.get_symbol(3, 2) == Symbol.PINK_SK
+        
+        with pytest.raises(ValueError):
+            grid.fill_rect(0, 6, 0, 1, Symbol.WILD)
+    
+    def test_set_and_get_batch(self):
+        """Test scattering and gathering symbol codes by flat index."""
+        grid = Grid()
+        grid.set_batch(np.array([0, 6, 24]), np.array([Symbol.WILD, Symbol.SCATTER, Symbol.PINK_SK]))
+        
+        assert grid.get_symbol(0, 0) == Symbol.WILD
+        assert grid.get_symbol(1, 1) == Symbol.SCATTER
+        assert grid.get_symbol(4, 4) == Symbol.PINK_SK
+        assert grid.count_symbol(Symbol.WILD) == 1
+        assert grid.get_batch(np.array([24, 0, 1])).tolist() == [
+            Symbol.PINK_SK, Symbol.WILD, Symbol.EMPTY]
+        
+        with pytest.raises(ValueError):
+            grid.set_batch(np.array([25]), Symbol.WILD)
+        with pytest.raises(ValueError):
+            grid.set_batch([0], [99])
+        with pytest.raises(ValueError):
+            grid.set_batch([0, 1], [Symbol.WILD, -1])
+        assert grid.get_symbol(0, 0) == Symbol.WILD
+        assert grid.validate()
+        with pytest.raises(ValueError):
+            grid.get_batch(np.array([-1]))
+    
+    def test_load_array(self):
+        """Test loading the grid from an array of symbol codes."""
+        grid = Grid()
+        codes = np.full((ROWS, COLS), Symbol.PINK_SK, dtype=np.int8)
+        codes[4, 0] = Symbol.SCATTER
+        
+        grid.load_array(codes)
+        
+        assert grid.get_symbol(0, 0) == Symbol.PINK_SK
+        assert grid.get_symbol(4, 0) == Symbol.SCATTER
+        assert grid.count_symbol(Symbol.PINK_SK) == TOTAL_POSITIONS - 1
+        
+        with pytest.raises(ValueError):
+            grid.load_array(np.zeros(24, dtype=np.int8))
+        with pytest.raises(ValueError):
+            grid.load_array(np.full(TOTAL_POSITIONS, 99, dtype=np.int8))
 
 
 class TestGridQueries:
@@ -245,6 +331,23 @@ class TestGravitySystem:
         assert grid.get_symbol(4, 0) == Symbol.GREEN_SK
         assert grid.is_empty(0, 0)
         assert grid.is_empty(1, 0)
+    
+    def test_gravity_every_column_pattern(self):
+        """Test gravity against a direct compaction for all 32 column fills."""
+        grid = Grid()
+        for mask in range(1 << ROWS):
+            grid.clear()
+            column = [Symbol.LADY_SK + row if mask >> row & 1 else Symbol.EMPTY
+                      for row in range(ROWS)]
+            for row, symbol in enumerate(column):
+                grid.set_symbol(row, 2, symbol)
+            
+            filled = [symbol for symbol in column if symbol != Symbol.EMPTY]
+            expected = [Symbol.EMPTY] * (ROWS - len(filled)) + filled
+            
+            moved = grid.apply_gravity()
+            assert [grid.get_symbol(row, 2) for row in range(ROWS)] == expected
+            assert moved == (expected != column)
 
 
 class TestSymbolDropping:
@@ -266,9 +369,7 @@ class TestSymbolDropping:
         assert dropped == 23
         
         # No empty positions remain
-        for row in range(ROWS):
-            for col in range(COLS):
-                assert not grid.is_empty(row, col)
+        assert (grid._symbols != Symbol.EMPTY).all()
     
     def test_drop_deterministic(self):
         """Test symbol dropping is deterministic."""
@@ -300,6 +401,23 @@ class TestSymbolDropping:
         
         # Should have more regular wilds than base game
         # (Can't test exact distribution in unit test, that's for integration tests)
+    
+    def test_settle_and_drop_matches_separate_steps(self):
+        """Test the fused gravity + drop gives the same grid and draws."""
+        for seed in range(20):
+            grid1 = Grid()
+            grid1.drop_new_symbols(SpinRNG(seed))
+            grid1.remove_positions([(0, 1), (2, 2), (3, 2), (4, 4), (1, seed % COLS)])
+            grid2 = grid1.copy()
+            rng1 = SpinRNG(seed + 100)
+            rng2 = SpinRNG(seed + 100)
+            
+            grid1.apply_gravity()
+            dropped = grid1.drop_new_symbols(rng1)
+            
+            assert grid2.settle_and_drop(rng2) == dropped
+            np.testing.assert_array_equal(grid1._symbols, grid2._symbols)
+            assert rng1.random() == rng2.random()
 
 
 class TestGridVisualization:
@@ -353,7 +471,7 @@ class TestGridSerialization:
         grid.set_symbol(3, 3, Symbol.SCATTER)
         
         # Serialize
-        state = grid.to_state()
+        state = grid.to_state_names()
         assert len(state) == TOTAL_POSITIONS
         assert state[0] == "LADY_SK"  # Position (0,0)
         assert state[6] == "WILD"      # Position (1,1)
@@ -363,7 +481,7 @@ class TestGridSerialization:
         
         # Deserialize to new grid
         new_grid = Grid()
-        new_grid.from_state(state)
+        new_grid.from_state_names(state)
         
         # Check restoration
         assert new_grid.get_symbol(0, 0) == Symbol.LADY_SK
@@ -378,11 +496,30 @@ class TestGridSerialization:
         
         # Wrong size
         with pytest.raises(ValueError):
-            grid.from_state(["LADY_SK"] * 10)
+            grid.from_state_names(["LADY_SK"] * 10)
+        with pytest.raises(ValueError):
+            grid.from_state(bytes(10))
         
         # Invalid symbol
         with pytest.raises(ValueError):
-            grid.from_state(["INVALID_SYMBOL"] + [""] * 24)
+            grid.from_state_names(["INVALID_SYMBOL"] + [""] * 24)
+        with pytest.raises(ValueError):
+            grid.from_state(bytes([99]) + bytes(24))
+    
+    def test_state_bytes_round_trip(self):
+        """Test the compact bytes state."""
+        grid = create_test_grid()
+        
+        state = grid.to_state()
+        assert isinstance(state, bytes)
+        assert len(state) == TOTAL_POSITIONS
+        assert state[0] == Symbol.LADY_SK
+        assert state[1] == Symbol.PINK_SK
+        assert state[2] == Symbol.EMPTY
+        
+        new_grid = Grid()
+        new_grid.from_state(state)
+        np.testing.assert_array_equal(new_grid._symbols, grid._symbols)
 
 
 class TestGridUtilities:
@@ -416,6 +553,58 @@ class TestGridUtilities:
         assert grid.is_empty(0, 0)
         assert grid.is_empty(2, 2)
         assert grid.get_symbol(1, 1) == Symbol.WILD  # Not removed
+        assert grid.count_symbol(Symbol.EMPTY) == TOTAL_POSITIONS - 1
+        
+        with pytest.raises(ValueError):
+            grid.remove_positions([(1, 1), (5, 0)])
+    
+    def test_set_symbols(self):
+        """Test setting many positions to one symbol."""
+        grid = Grid()
+        positions = [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)]
+        assert grid.count_symbol(Symbol.PINK_SK) == 0
+        
+        grid.set_symbols(positions, Symbol.PINK_SK)
+        
+        assert grid.find_all_positions(Symbol.PINK_SK) == positions
+        assert grid.count_symbol(Symbol.PINK_SK) == len(positions)
+        
+        with pytest.raises(ValueError):
+            grid.set_symbols([(0, 0), (0, -1)], Symbol.WILD)
+        
+        # A failed call writes nothing and leaves the counts current
+        assert grid.get_symbol(0, 0) == Symbol.PINK_SK
+        assert grid.count_symbol(Symbol.PINK_SK) == len(positions)
+        assert grid.count_symbol(Symbol.WILD) == 0
+    
+    def test_set_mask(self):
+        """Test writing the cells of a bitboard, and the bitboard helpers."""
+        grid = Grid()
+        grid.fill(Symbol.LADY_SK)
+        mask = (1 << 0) | (1 << 7) | (1 << 24)
+        
+        grid.set_mask(mask, Symbol.EMPTY)
+        
+        assert grid.find_all_positions(Symbol.EMPTY) == [(0, 0), (1, 2), (4, 4)]
+        assert grid.count_symbol(Symbol.LADY_SK) == TOTAL_POSITIONS - 3
+        assert mask_to_positions(mask) == [(0, 0), (1, 2), (4, 4)]
+        assert flags_to_mask(mask_to_flags(mask)) == mask
+        assert flags_to_mask(grid.cells().ravel() == Symbol.EMPTY) == mask
+    
+    def test_remove_positions_array(self):
+        """Test removing positions given as an (n, 2) array."""
+        grid = Grid()
+        grid.fill(Symbol.LADY_SK)
+        positions = np.array([[0, 0], [2, 3], [4, 4]], dtype=np.int16)
+        
+        grid.remove_positions(positions)
+        
+        assert grid.find_all_positions(Symbol.EMPTY) == [(0, 0), (2, 3), (4, 4)]
+        assert grid.count_symbol(Symbol.LADY_SK) == TOTAL_POSITIONS - 3
+        
+        grid.remove_positions(np.empty((0, 2), dtype=np.int16))
+        with pytest.raises(ValueError):
+            grid.remove_positions(np.array([[1, 1], [0, 5]]))
     
     def test_grid_validation(self):
         """Test grid validation."""
@@ -2,7 +2,9 @@
 
 import pytest
 import numpy as np
-from simulator.core.rng import SpinRNG, create_worker_rng, verify_determinism
+from simulator.core.rng import (
+    SpinRNG, create_worker_rng, verify_determinism, worker_seed, _NUMPY_BATCH_MIN
+)
 
 
 class TestSpinRNG:
@@ -15,19 +17,37 @@ class TestSpinRNG:
         rng2 = SpinRNG(seed)
         
         # Generate some random numbers
-        results1 = [rng1.random() for _ in range(100)]
-        results2 = [rng2.random() for _ in range(100)]
+        results1 = rng1.random_batch(100)
+        results2 = rng2.random_batch(100)
         
         # Should be identical
-        assert results1 == results2
+        np.testing.assert_array_equal(results1, results2)
+    
+    def test_random_batch_matches_random(self):
+        """Test that a batch draws the same stream as repeated random() calls."""
+        rng1 = SpinRNG(7)
+        rng2 = SpinRNG(7)
+        
+        assert rng1.random_batch(50).tolist() == [rng2.random() for _ in range(50)]
+        assert rng1.get_call_count() == rng2.get_call_count() == 50
+        assert rng1.random() == rng2.random()
+    
+    def test_large_random_batch_matches_random(self):
+        """Test that large batches drawn in NumPy stay on the same stream."""
+        rng1 = SpinRNG(7)
+        rng2 = SpinRNG(7)
+        n = 3 * _NUMPY_BATCH_MIN
+        
+        assert rng1.random_batch(n).tolist() == [rng2.random() for _ in range(n)]
+        assert rng1.random() == rng2.random()
+        assert rng1.randint(1, 1000) == rng2.randint(1, 1000)
     
     def test_random_range(self):
         """Test that random() returns values in [0, 1)."""
         rng = SpinRNG(42)
         
-        for _ in range(1000):
-            value = rng.random()
-            assert 0.0 <= value < 1.0
+        values = rng.random_batch(1000)
+        assert ((values >= 0.0) & (values < 1.0)).all()
     
     def test_randint_range(self):
         """Test that randint returns values in specified range."""
@@ -98,6 +118,25 @@ class TestSpinRNG:
         with pytest.raises(ValueError):
             rng.weighted_choice(['A'], [0])  # All zero weights
     
+    def test_weighted_choice_numpy_batch_distribution(self):
+        """Test batched weighted draw frequencies with a single draw."""
+        rng = SpinRNG(42)
+        weights = np.array([1, 2, 7]) / 10  # C should be selected ~70% of the time
+        iterations = 10000
+        
+        draws = rng.weighted_choice_numpy_batch(np.arange(3), weights, iterations)
+        frequencies = np.bincount(draws, minlength=3) / iterations
+        
+        # Check approximate distribution
+        np.testing.assert_allclose(frequencies, weights, atol=0.02)
+
+    def test_weighted_choice_zero_weight_never_selected(self):
+        """Test that zero-weight entries are skipped by the cumulative search."""
+        rng = SpinRNG(42)
+
+        for _ in range(1000):
+            assert rng.weighted_choice(['A', 'B', 'C'], [0, 1, 0]) == 'B'
+
     def test_weighted_choice_numpy(self):
         """Test NumPy weighted choice method."""
         rng = SpinRNG(42)
@@ -117,6 +156,20 @@ class TestSpinRNG:
         assert abs(counts['B'] / iterations - 0.2) < 0.02
         assert abs(counts['C'] / iterations - 0.7) < 0.02
     
+    def test_weighted_choice_numpy_batch_matches_loop(self):
+        """Test that a batch of weighted draws equals the per-call loop."""
+        choices = np.array(['A', 'B', 'C'])
+        weights = np.array([0.1, 0.2, 0.7])
+        rng1 = SpinRNG(42)
+        rng2 = SpinRNG(42)
+        
+        batch = rng1.weighted_choice_numpy_batch(choices, weights, 200)
+        loop = [rng2.weighted_choice_numpy(choices, weights) for _ in range(200)]
+        
+        assert batch.tolist() == loop
+        assert rng1.get_call_count() == rng2.get_call_count()
+        assert rng1.random() == rng2.random()
+    
     def test_shuffle(self):
         """Test shuffle method."""
         rng = SpinRNG(42)
@@ -222,11 +275,13 @@ class TestParallelDeterminism:
         """Test that there's no obvious correlation between workers."""
         base_seed = 12345
         
+        # Worker seeds are a pure function of the worker id
+        seeds = [worker_seed(base_seed, worker_id) for worker_id in range(100)]
+        assert len(set(seeds)) == len(seeds)
+        assert create_worker_rng(base_seed, 42).get_seed() == seeds[42]
+        
         # Generate first values from multiple workers
-        first_values = []
-        for worker_id in range(100):
-            rng = create_worker_rng(base_seed, worker_id)
-            first_values.append(rng.random())
+        first_values = [SpinRNG(seed).random() for seed in seeds]
         
         # Check that values are well-distributed
         # Simple test: values should span most of [0, 1)
@@ -7,7 +7,8 @@ from simulator.core.symbol import (
     can_be_destroyed_by_explosion, can_substitute, get_display_string,
     get_config_string, from_config_string, symbols_match_for_cluster,
     HIGH_PAY_SYMBOLS, LOW_PAY_SYMBOLS, PAYING_SYMBOLS, WILD_SYMBOLS,
-    SPECIAL_SYMBOLS, ALL_SYMBOLS
+    SPECIAL_SYMBOLS, ALL_SYMBOLS, LOW_PAY_CODES, PRESERVED_SYMBOLS,
+    HIGH_PAY_MASK, LOW_PAY_MASK, PAYING_MASK, WILD_MASK, SPECIAL_MASK, ALL_MASK
 )
 
 
@@ -26,6 +27,12 @@ class TestSymbolEnumeration:
         for symbol in expected_symbols:
             assert isinstance(symbol, Symbol)
     
+    def test_symbol_integer_codes(self):
+        """Test that symbols are contiguous integer codes with EMPTY as 0."""
+        assert Symbol.EMPTY == 0
+        assert [int(symbol) for symbol in Symbol] == list(range(len(Symbol)))
+        assert Symbol(int(Symbol.E_WILD)) is Symbol.E_WILD
+    
     def test_symbol_categories(self):
         """Test symbol category sets."""
         # High pay
@@ -36,6 +43,11 @@ class TestSymbolEnumeration:
             Symbol.PINK_SK, Symbol.GREEN_SK, Symbol.BLUE_SK,
             Symbol.ORANGE_SK, Symbol.CYAN_SK
         }
+        assert set(LOW_PAY_CODES) == {int(s) for s in LOW_PAY_SYMBOLS}
+        assert PRESERVED_SYMBOLS == {
+            Symbol.LADY_SK, Symbol.WILD, Symbol.E_WILD, Symbol.SCATTER
+        }
+        assert isinstance(LOW_PAY_SYMBOLS, frozenset)
         
         # Paying symbols
         assert PAYING_SYMBOLS == HIGH_PAY_SYMBOLS | LOW_PAY_SYMBOLS
@@ -50,6 +62,15 @@ class TestSymbolEnumeration:
         # All symbols (excluding empty)
         assert ALL_SYMBOLS == PAYING_SYMBOLS | WILD_SYMBOLS | SPECIAL_SYMBOLS
         assert len(ALL_SYMBOLS) == 9
+    
+    def test_symbol_category_masks(self):
+        """Test category bitmasks have exactly the bits of their sets."""
+        for mask, symbols in [
+            (HIGH_PAY_MASK, HIGH_PAY_SYMBOLS), (LOW_PAY_MASK, LOW_PAY_SYMBOLS),
+            (PAYING_MASK, PAYING_SYMBOLS), (WILD_MASK, WILD_SYMBOLS),
+            (SPECIAL_MASK, SPECIAL_SYMBOLS), (ALL_MASK, ALL_SYMBOLS),
+        ]:
+            assert mask == sum(1 << symbol for symbol in symbols)
 
 
 class TestSymbolProperties:
@@ -171,6 +192,9 @@ class TestSymbolDisplay:
         assert get_display_string(Symbol.WILD) == "WLD"
         assert get_display_string(Symbol.E_WILD) == "EW "
         assert get_display_string(Symbol.SCATTER) == "SCR"
+        
+        # Unknown values fall back instead of raising
+        assert get_display_string(99) == "???"
     
     def test_config_strings(self):
         """Test configuration string mapping."""
@@ -182,6 +206,7 @@ class TestSymbolDisplay:
         
         # Empty has no config string
         assert get_config_string(Symbol.EMPTY) == ""
+        assert get_config_string(99) == ""
     
     def test_string_to_symbol_conversion(self):
         """Test converting config strings back to symbols."""
@@ -234,6 +259,17 @@ class TestClusterMatching:
         # Different symbols don't match
         assert not symbols_match_for_cluster(Symbol.LADY_SK, Symbol.PINK_SK)
         assert not symbols_match_for_cluster(Symbol.PINK_SK, Symbol.GREEN_SK)
+    
+    def test_matching_is_symmetric_over_all_pairs(self):
+        """Test the precomputed match table for every pair of symbols."""
+        for symbol1 in Symbol:
+            for symbol2 in Symbol:
+                expected = (symbol1 in PAYING_SYMBOLS | WILD_SYMBOLS
+                            and symbol2 in PAYING_SYMBOLS | WILD_SYMBOLS
+                            and (symbol1 == symbol2 or symbol1 in WILD_SYMBOLS
+                                 or symbol2 in WILD_SYMBOLS))
+                assert symbols_match_for_cluster(symbol1, symbol2) is expected
+                assert symbols_match_for_cluster(symbol2, symbol1) is expected
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 """Unit tests for Union-Find data structure."""
 
 import pytest
-from simulator.core.union_find import UnionFind, GridUnionFind
+from simulator.core.union_find import UnionFind, GridUnionFind, _NUMPY_ROOTS_MIN
 
 
 class TestUnionFind:
@@ -124,6 +124,23 @@ class TestUnionFind:
         # Singleton set
         members = uf.get_set_members(3)
         assert members == [3]
+    
+    def test_large_set_queries_match_find(self):
+        """Test that large structures resolve sets the same way as find()."""
+        size = 2 * _NUMPY_ROOTS_MIN
+        uf = UnionFind(size)
+        for i in range(size - 3):
+            uf.union(i, i + 3)  # One long chain per residue mod 3
+        uf.union(1, 2)
+        
+        roots = [uf.find(i) for i in range(size)]
+        sets = uf.get_sets()
+        
+        assert len(sets) == uf.num_sets() == 2
+        for root, members in sets.items():
+            assert members == [i for i in range(size) if roots[i] == root]
+        assert uf.get_set_members(5) == sets[uf.find(5)]
+        assert uf.get_set_size(0) == size // 3 + 1
 
 
 class TestGridUnionFind:
@@ -3,6 +3,7 @@ Unit tests for the wild spawning system.
 """
 
 import unittest
+import numpy as np
 from simulator.core.wild_spawning import WildSpawningSystem, WildSpawn
 from simulator.core.grid import Grid
 from simulator.core.clusters import Cluster
@@ -10,6 +11,12 @@ from simulator.core.symbol import Symbol
 from simulator.core.rng import SpinRNG
 
 
+# Membership constants, built once instead of per assertion
+_WILD_KINDS = frozenset({Symbol.WILD, Symbol.E_WILD})
+_FOOTPRINT_5 = frozenset({(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)})
+_FOOTPRINT_5_OPEN = _FOOTPRINT_5 - {(0, 0), (0, 1)}
+
+
 class TestWildSpawning(unittest.TestCase):
     """Test cases for wild spawning mechanics."""
     
@@ -28,30 +35,24 @@ class TestWildSpawning(unittest.TestCase):
             size=5
         )
         
-        # Run many spawn attempts to check distribution
-        wild_count = 0
-        explosivo_count = 0
+        # Draw many spawns in one batch to check the distribution
         iterations = 1000
+        wild_types, _ = self.system.batch_spawn_for_cluster(cluster, iterations, self.rng)
         
-        for i in range(iterations):
-            rng = SpinRNG(seed=i)  # Different seed each time
-            spawn = self.system._create_spawn_attempt(0, cluster, rng)
-            
-            if spawn.wild_type == Symbol.WILD:
-                wild_count += 1
-            else:
-                explosivo_count += 1
+        # The single-spawn path picks one of the two wild kinds
+        spawn = self.system._create_spawn_attempt(0, cluster, SpinRNG(seed=0))
+        self.assertIn(spawn.wild_type, _WILD_KINDS)
         
         # Check that distribution is roughly 50/50 (with some tolerance)
-        wild_ratio = wild_count / iterations
+        wild_ratio = np.count_nonzero(wild_types == Symbol.WILD) / iterations
+        self.assertTrue(np.isin(wild_types, list(_WILD_KINDS)).all())
         self.assertGreater(wild_ratio, 0.45)
         self.assertLess(wild_ratio, 0.55)
     
     def test_empty_position_selection(self):
         """Test that wilds only spawn in empty positions within footprint."""
         # Create a grid with some occupied positions
-        self.grid.set_symbol(0, 0, Symbol.PINK_SK)
-        self.grid.set_symbol(0, 1, Symbol.PINK_SK)
+        self.grid.set_symbols([(0, 0), (0, 1)], Symbol.PINK_SK)
         # (1,0), (1,1), (2,0) are empty
         
         cluster = Cluster(
@@ -70,18 +71,17 @@ class TestWildSpawning(unittest.TestCase):
         self.assertTrue(spawn.success)
         
         # Check position is one of the empty ones in footprint
-        self.assertIn(spawn.spawned_position, [(1, 0), (1, 1), (2, 0)])
+        self.assertIn(spawn.spawned_position, _FOOTPRINT_5_OPEN)
         
         # Check wild was placed on grid
         row, col = spawn.spawned_position
-        self.assertIn(self.grid.get_symbol(row, col), [Symbol.WILD, Symbol.E_WILD])
+        self.assertIn(self.grid.get_symbol(row, col), _WILD_KINDS)
     
     def test_no_spawn_when_footprint_full(self):
         """Test that spawn fails when entire footprint is occupied."""
         # Fill entire cluster footprint
         positions = [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)]
-        for row, col in positions:
-            self.grid.set_symbol(row, col, Symbol.PINK_SK)
+        self.grid.set_symbols(positions, Symbol.PINK_SK)
         
         cluster = Cluster(
             symbol=Symbol.PINK_SK,
@@ -134,8 +134,8 @@ class TestWildSpawning(unittest.TestCase):
         self.assertNotEqual(spawns[0].spawned_position, spawns[1].spawned_position)
         
         # Each position should be in respective footprint
-        self.assertIn(spawns[0].spawned_position, cluster1.positions)
-        self.assertIn(spawns[1].spawned_position, cluster2.positions)
+        self.assertIn(spawns[0].spawned_position, cluster1)
+        self.assertIn(spawns[1].spawned_position, cluster2)
     
     def test_deterministic_spawn_order(self):
         """Test that spawn order is deterministic with same RNG seed."""
@@ -211,7 +211,7 @@ class TestWildSpawning(unittest.TestCase):
         
         self.assertEqual(len(spawns), 1)
         self.assertTrue(spawns[0].success)
-        self.assertIn(spawns[0].spawned_position, cluster.positions)
+        self.assertIn(spawns[0].spawned_position, cluster)
     
     def test_uniform_position_distribution(self):
         """Test that position selection is uniformly random."""
@@ -222,24 +222,48 @@ class TestWildSpawning(unittest.TestCase):
             size=5
         )
         
-        # Count how many times each position is selected
-        position_counts = {pos: 0 for pos in cluster.positions}
+        # Draw every selection in one batch and count each position
         iterations = 1000
+        _, positions = self.system.batch_spawn_for_cluster(cluster, iterations, self.rng)
+        counts = np.bincount(positions, minlength=25)
         
-        for i in range(iterations):
-            grid = Grid()  # Fresh empty grid
-            rng = SpinRNG(seed=i)
-            spawns = self.system.spawn_wilds_for_clusters(grid, [cluster], rng)
-            
-            if spawns[0].success:
-                position_counts[spawns[0].spawned_position] += 1
+        # Only footprint positions are ever selected
+        self.assertEqual(counts[list(cluster.indices)].sum(), iterations)
         
         # Each position should be selected roughly 1/5 of the time
         expected_count = iterations / len(cluster.positions)
-        for pos, count in position_counts.items():
+        for idx in cluster.indices:
             # Allow 20% deviation from expected
-            self.assertGreater(count, expected_count * 0.8)
-            self.assertLess(count, expected_count * 1.2)
+            self.assertGreater(counts[idx], expected_count * 0.8)
+            self.assertLess(counts[idx], expected_count * 1.2)
+    
+    def test_spawn_pipeline_distribution(self):
+        """Test the samplers spawn_wilds_for_clusters itself uses, at small N."""
+        cluster = Cluster(
+            symbol=Symbol.PINK_SK,
+            positions=[(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)],
+            size=5
+        )
+        
+        iterations = 250
+        position_counts = np.zeros(25, dtype=np.intp)
+        wild_count = 0
+        for _ in range(iterations):
+            self.grid.reset()
+            spawn, = self.system.spawn_wilds_for_clusters(self.grid, [cluster], self.rng)
+            row, col = spawn.spawned_position
+            position_counts[row * 5 + col] += 1
+            wild_count += spawn.wild_type == Symbol.WILD
+        
+        # Only footprint positions, each near 1/5 of the spawns
+        self.assertEqual(position_counts[list(cluster.indices)].sum(), iterations)
+        expected_count = iterations / len(cluster.positions)
+        for idx in cluster.indices:
+            # Allow 40% deviation from expected at this sample size
+            self.assertGreater(position_counts[idx], expected_count * 0.6)
+            self.assertLess(position_counts[idx], expected_count * 1.4)
+        
+        self.assertAlmostEqual(wild_count / iterations, 0.5, delta=0.1)
 
 
 if __name__ == '__main__':